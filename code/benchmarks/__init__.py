@@ -0,0 +1 @@
+# 성능 측정 스크립트 모음 (code/ 폴더에서 python -m benchmarks run 으로 전체, python -m benchmarks.<이름> 으로 하나만 실행)
@@ -0,0 +1,131 @@
+"""벤치마크 모음 실행 + 기준값(JSON) 저장/비교
+
+  python -m benchmarks run [--quick] [--only maze_gen,render] [--save baseline.json]
+  python -m benchmarks compare baseline.json [new.json] [--threshold 0.15] [--quick]
+
+compare는 new.json이 없으면 지금 다시 측정해서 비교하고,
+중간값(median_ms)이 기준보다 threshold 비율 이상 느려진 항목이 있으면 종료 코드 1
+(아주 짧은 항목의 잡음은 무시하도록 차이가 min_delta_ms 미만이면 느려진 것으로 보지 않음)
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+from benchmarks import maze_gen, generators, has_path, render, frame, boss_ai
+
+SUITES = {
+    "maze_gen": maze_gen,
+    "generators": generators,
+    "has_path": has_path,
+    "render": render,
+    "frame": frame,
+    "boss_ai": boss_ai,
+}
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_MIN_DELTA_MS = 0.05
+
+def run_suites(names=None, quick=False):
+    results = {}
+    for name in names or SUITES:
+        print(f"# {name} ...", file=sys.stderr)
+        results.update(SUITES[name].collect(quick=quick))
+    return results
+
+def _meta(quick):
+    try:
+        import pygame
+        pygame_version = pygame.version.ver
+    except ImportError:
+        pygame_version = None
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "pygame": pygame_version,
+        "quick": quick,
+    }
+
+def save(path, results, quick=False):
+    with open(path, "w") as f:
+        json.dump({"meta": _meta(quick), "results": results}, f, indent=2, sort_keys=True)
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def compare(base, new, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS):
+    """(이름, 기준 ms, 새 ms, 변화율, 상태) 목록, 상태: "REGRESSION" / "faster" / "ok" / "new" / "missing" """
+    rows = []
+    for name in sorted(set(base) | set(new)):
+        if name not in base:
+            rows.append((name, None, new[name]["median_ms"], None, "new"))
+            continue
+        if name not in new:
+            rows.append((name, base[name]["median_ms"], None, None, "missing"))
+            continue
+        b, n = base[name]["median_ms"], new[name]["median_ms"]
+        change = (n - b) / b if b > 0 else 0.0
+        if abs(n - b) < min_delta_ms:
+            status = "ok"
+        else:
+            status = "REGRESSION" if change > threshold else "faster" if change < -threshold else "ok"
+        rows.append((name, b, n, change, status))
+    return rows
+
+def print_comparison(rows):
+    width = max([34] + [len(row[0]) for row in rows])
+    print(f"{'benchmark':<{width}} {'base(ms)':>10} {'new(ms)':>10} {'change':>8}  status")
+    for name, b, n, change, status in rows:
+        fb = f"{b:>10.3f}" if b is not None else f"{'-':>10}"
+        fn = f"{n:>10.3f}" if n is not None else f"{'-':>10}"
+        fc = f"{change:>+8.1%}" if change is not None else f"{'-':>8}"
+        print(f"{name:<{width}} {fb} {fn} {fc}  {status}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="성능 벤치마크 모음")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_run = sub.add_parser("run", help="측정하고 결과 출력 (--save로 기준값 저장)")
+    p_cmp = sub.add_parser("compare", help="기준값과 비교")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("new", nargs="?", help="비교할 결과 JSON (없으면 지금 측정)")
+    p_cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="느려짐 허용 비율 (기본 0.15)")
+    p_cmp.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS, help="이보다 작은 차이는 무시 (기본 0.05ms)")
+    for p in (p_run, p_cmp):
+        p.add_argument("--quick", action="store_true", help="큰 크기는 빼고 빠르게")
+        p.add_argument("--only", default=None, help=f"쉼표로 구분 ({', '.join(SUITES)})")
+        p.add_argument("--save", default=None, help="측정 결과를 JSON으로 저장")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else None
+    for name in names or ():
+        if name not in SUITES:
+            parser.error(f"알 수 없는 벤치마크: {name}")
+
+    if args.command == "compare" and args.new:
+        results = load(args.new)
+    else:
+        results = run_suites(names, args.quick)
+        if args.save:
+            save(args.save, results, args.quick)
+
+    if args.command == "run":
+        from benchmarks.timing import print_results
+        print_results(results)
+        return 0
+
+    base = load(args.baseline)
+    if names:
+        base = {k: v for k, v in base.items() if k in results}
+    rows = compare(base, results, args.threshold, args.min_delta_ms)
+    print_comparison(rows)
+    regressions = [r for r in rows if r[4] == "REGRESSION"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""보스 추격 AI 프레임 비용 측정
+미로 크기를 키워도 FlowField.update(budget) + Boss.update 의 프레임당 비용이 일정한지 확인한다
+
+실행: (code/ 폴더에서) python -m benchmarks.boss_ai
+"""
+import random
+import sys
+import time
+
+from maze import generate_maze_eller, DX, DY
+from pathfinding import FlowField
+from boss import Boss
+
+SIZES = [30, 100, 300, 1000]
+FRAMES = 2000
+BOSS_COUNT = 4
+CELL = 50
+PLAYER_STEP_FRAMES = 8  # 플레이어가 8프레임마다 한 칸 이동한다고 가정 (HARD 기준 속도)
+
+def run(size, frames=FRAMES, bosses=BOSS_COUNT, seed=1):
+    grid = generate_maze_eller(size, size, seed, packed=True)
+    rng = random.Random(seed)
+    flow = FlowField(grid)
+    boss_list = [Boss(rng.randrange(size), rng.randrange(size), CELL, speed=CELL // 20)
+                 for _ in range(bosses)]
+    px, py = 0, 0
+
+    costs = []
+    for frame in range(frames):
+        if frame % PLAYER_STEP_FRAMES == 0:
+            # 플레이어 무작위 이동 (열린 방향으로만)
+            cell = grid[py][px]
+            dirs = [d for d in (1, 2, 4, 8) if cell & d]
+            d = rng.choice(dirs)
+            px, py = px + DX[d], py + DY[d]
+
+        t0 = time.perf_counter()
+        flow.set_target(px, py)
+        flow.update()
+        for b in boss_list:
+            b.update(flow)
+        costs.append(time.perf_counter() - t0)
+
+    costs.sort()
+    return {
+        "size": size,
+        "median_us": costs[len(costs) // 2] * 1e6,
+        "mean_us": sum(costs) / len(costs) * 1e6,
+        "p95_us": costs[int(len(costs) * 0.95)] * 1e6,
+        "max_us": costs[-1] * 1e6,
+    }
+
+def collect(quick=False):
+    """벤치마크 모음(python -m benchmarks)용 결과 (ms 단위)"""
+    results = {}
+    for size in (SIZES[:2] if quick else SIZES):
+        r = run(size)
+        results[f"boss_ai.frame.{size}x{size}"] = {
+            "median_ms": r["median_us"] / 1000,
+            "mean_ms": r["mean_us"] / 1000,
+            "p95_ms": r["p95_us"] / 1000,
+            "max_ms": r["max_us"] / 1000,
+            "runs": FRAMES,
+        }
+    return results
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = [int(a) for a in argv] or SIZES
+    print(f"{'maze':>10} {'mean(us)':>10} {'p95(us)':>10} {'max(us)':>10}")
+    for size in sizes:
+        r = run(size)
+        print(f"{size:>4}x{size:<5} {r['mean_us']:>10.1f} {r['p95_us']:>10.1f} {r['max_us']:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""게임 루프 한 프레임 전체 비용 측정 (규칙 step + 그리기, 화면 없이 오프스크린 Surface)
+main.py 루프와 같은 순서로 step -> 미로 복원/그리기 -> 스프라이트/HUD -> 더티 렉트 계산을 돌린다.
+- dirty: 평소 프레임 (바뀐 부분만 다시 그리기)
+- full: 매 프레임 전체 다시 그리기 (메뉴 오버레이, 창 크기 변경 직후 등)
+- camera: 창보다 훨씬 큰 미로 (카메라가 플레이어를 따라가고 보이는 벽 조각만 그림)
+
+실행: (code/ 폴더에서) python -m benchmarks.frame
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+
+import pygame
+
+from difficulty import Difficulty, EASY, HARD
+from game_state import GameState, step, STEP_MS, UP, DOWN, LEFT, RIGHT, ATTACK_KEY
+from renderer import draw_maze_view, DirtyRectTracker, follow_view
+from main import draw_world, camera_focus
+from benchmarks.timing import summarize, print_results
+
+FRAMES = 600
+QUICK_FRAMES = 200
+ACTIONS = [UP, DOWN, LEFT, RIGHT, ATTACK_KEY]
+
+# 카메라 모드: 500x500 미로를 1024x768 창에서
+BIG = Difficulty(width=500, height=500, cell=20, time_limit=600, name="Easy")
+BIG_WINDOW = (1024, 768)
+
+def run(difficulty, frames, full_redraw, seed=1, window=None):
+    pygame.init()
+    width, height, cell = difficulty.width, difficulty.height, difficulty.cell
+    screen = pygame.Surface(window or (width * cell, height * cell))
+    font = pygame.font.Font(None, 24)
+    view = None
+    tracker = DirtyRectTracker()
+    rng = random.Random(seed)
+    state = GameState(difficulty, seed)
+
+    times = []
+    for frame in range(frames):
+        if state.is_over:
+            # 세션이 끝나면 같은 seed로 다시 시작 (미로 캐시/레이어 캐시는 그대로)
+            state = GameState(difficulty, seed)
+            tracker.invalidate()
+        inputs = [rng.choice(ACTIONS)] if frame % 8 == 0 else []
+
+        t0 = time.perf_counter()
+        step(state, inputs, STEP_MS)
+        prev_origin = view.origin if view is not None else None
+        view = follow_view(screen.get_size(), width, height, cell, camera_focus(state, 0.0))
+        if view.origin != prev_origin:
+            tracker.invalidate()
+        if full_redraw or tracker.full_redraw:
+            draw_maze_view(screen, state.grid, view, state.goal_x, state.goal_y, state.wall_segments())
+        else:
+            tracker.restore_view(screen, state.grid, view, state.goal_x, state.goal_y, state.wall_segments())
+        rects = draw_world(screen, state, view, 0.0, font)
+        tracker.finish(rects, screen.get_rect())
+        times.append(time.perf_counter() - t0)
+    return summarize(times)
+
+def collect(quick=False):
+    frames = QUICK_FRAMES if quick else FRAMES
+    results = {}
+    for difficulty in (EASY, HARD):
+        name = difficulty.name.lower()
+        results[f"frame.{name}.dirty"] = run(difficulty, frames, full_redraw=False)
+        results[f"frame.{name}.full"] = run(difficulty, frames, full_redraw=True)
+    results["frame.camera_500x500.dirty"] = run(BIG, frames, full_redraw=False, window=BIG_WINDOW)
+    results["frame.camera_500x500.full"] = run(BIG, frames, full_redraw=True, window=BIG_WINDOW)
+    return results
+
+def main():
+    print_results(collect())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""미로 생성 알고리즘 비교 (maze.GENERATORS 전부)
+- 속도: 난이도 크기(EASY/HARD)와 200x200에서 한 개 생성 시간
+- 지표: maze_batch.analyze_maze 평균 + 난이도 목표 구간(Difficulty.target)에 드는 비율
+
+Difficulty.generator 를 고를 때 쓰는 기준: 목표 구간에 드는 미로가 min_fraction 이상인
+생성기 중 가장 빠른 것 (seed 은행을 쓰면 구간 밖 seed는 걸러지므로 비율이 낮아도 되지만,
+은행 없이 무작위 seed로 시작하는 프런트엔드는 비율이 곧 "원하는 느낌의 미로가 나올 확률")
+
+실행: (code/ 폴더에서) python -m benchmarks.generators [--samples 200]
+"""
+import argparse
+import time
+
+from difficulty import EASY, HARD
+from maze import BATCH_GENERATORS, GENERATORS, generate_maze_batch
+from maze_batch import analyze_maze
+from benchmarks.timing import measure, print_results
+
+BIG_SIZE = 200
+BATCH_COUNT = 1000  # generate_maze_batch 한 번에 만드는 미로 수
+METRICS = ("solution_length", "dead_ends", "junctions", "branching_factor", "boss_distance")
+DEFAULT_SAMPLES = 200
+MIN_FRACTION = 0.5
+
+def collect(quick=False):
+    results = {}
+    for name, generate in GENERATORS.items():
+        for difficulty in (EASY, HARD):
+            w, h = difficulty.width, difficulty.height
+            results[f"generators.{name}.{w}x{h}"] = measure(lambda: generate(w, h, 1, packed=True))
+        if not quick:
+            results[f"generators.{name}.{BIG_SIZE}x{BIG_SIZE}"] = measure(
+                lambda: generate(BIG_SIZE, BIG_SIZE, 1, packed=True), min_runs=1)
+    try:
+        import numpy  # noqa: F401  (배치 생성은 numpy 필요)
+    except ImportError:
+        return results
+    # generators.<이름>.batch[_compat].WxH: 미로 BATCH_COUNT개를 한 번에 (같은 크기의 한 개 생성 x BATCH_COUNT 와 비교)
+    # batch: 빠른 기본 경로, batch_compat: random.Random 난수열 재현 (maze_batch/seed 은행이 쓰는 경로)
+    for name in BATCH_GENERATORS:
+        for difficulty in (EASY, HARD):
+            w, h = difficulty.width, difficulty.height
+            for label, compat in (("batch", False), ("batch_compat", True)):
+                results[f"generators.{name}.{label}.{w}x{h}"] = measure(
+                    lambda: generate_maze_batch(w, h, range(BATCH_COUNT), name, compat=compat), min_runs=1)
+    return results
+
+def _in_band(stats, target):
+    for metric, (lo, hi) in (target or {}).items():
+        value = stats[metric]
+        if (lo is not None and value < lo) or (hi is not None and value > hi):
+            return False
+    return True
+
+def compare_generators(difficulty, samples=DEFAULT_SAMPLES, generators=None):
+    """생성기마다 {"name", "ms", "in_band", 지표 평균...} -> 빠른 순서 목록
+    ms: 미로 하나 평균 생성 시간, in_band: difficulty.target 구간에 든 비율 (seed 0 ~ samples-1)"""
+    w, h = difficulty.width, difficulty.height
+    rows = []
+    for name in generators or GENERATORS:
+        generate = GENERATORS[name]
+        sums = dict.fromkeys(METRICS, 0.0)
+        in_band = 0
+        elapsed = 0.0
+        for seed in range(samples):
+            t0 = time.perf_counter()
+            grid = generate(w, h, seed, packed=True)
+            elapsed += time.perf_counter() - t0
+            stats = analyze_maze(grid, w, h, seed)
+            for metric in METRICS:
+                sums[metric] += stats[metric]
+            in_band += _in_band(stats, difficulty.target)
+        row = {"name": name, "ms": elapsed / samples * 1000, "in_band": in_band / samples}
+        row.update({metric: total / samples for metric, total in sums.items()})
+        rows.append(row)
+    rows.sort(key=lambda r: r["ms"])
+    return rows
+
+def fastest_generator(difficulty, samples=DEFAULT_SAMPLES, min_fraction=MIN_FRACTION, rows=None):
+    """목표 구간 비율이 min_fraction 이상인 생성기 중 가장 빠른 것의 이름 (없으면 None)"""
+    for row in rows or compare_generators(difficulty, samples):
+        if row["in_band"] >= min_fraction:
+            return row["name"]
+    return None
+
+def print_comparison(difficulty, rows, min_fraction=MIN_FRACTION):
+    print(f"\n{difficulty.name} {difficulty.width}x{difficulty.height}  target={difficulty.target}")
+    print(f"{'generator':<12} {'ms':>8} {'in_band':>8} " + " ".join(f"{m[:10]:>10}" for m in METRICS))
+    for row in rows:
+        print(f"{row['name']:<12} {row['ms']:>8.3f} {row['in_band']:>8.0%} "
+              + " ".join(f"{row[m]:>10.2f}" for m in METRICS))
+    print(f"-> fastest with in_band >= {min_fraction:.0%}: {fastest_generator(difficulty, rows=rows, min_fraction=min_fraction)}"
+          f" (current: {difficulty.generator})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="미로 생성 알고리즘 속도/지표 비교")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="난이도마다 비교할 seed 수")
+    parser.add_argument("--min-fraction", type=float, default=MIN_FRACTION)
+    parser.add_argument("--timing", action="store_true", help="속도 표(collect)만 출력")
+    args = parser.parse_args(argv)
+    if args.timing:
+        print_results(collect())
+        return
+    for difficulty in (EASY, HARD):
+        print_comparison(difficulty, compare_generators(difficulty, args.samples), args.min_fraction)
+
+if __name__ == "__main__":
+    main()
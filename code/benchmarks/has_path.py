@@ -0,0 +1,28 @@
+"""경로 확인 비용 측정 (debuff.has_path)
+- has_path: 출발점 -> 반대쪽 모서리 확인 (도착점에서 멈추는 BFS 한 번)
+- distance_field: 같은 미로의 출발점 전체 거리장 (pathfinding.compute_distance_field)
+
+실행: (code/ 폴더에서) python -m benchmarks.has_path
+"""
+from maze import generate_maze
+from pathfinding import compute_distance_field
+from debuff import has_path
+from benchmarks.timing import measure, print_results
+
+SIZES = [20, 100, 500]
+QUICK_SIZES = [20, 100]
+
+def collect(quick=False):
+    results = {}
+    for size in (QUICK_SIZES if quick else SIZES):
+        grid = generate_maze(size, size, 1, packed=True)
+        g = size - 1
+        results[f"has_path.{size}x{size}"] = measure(lambda: has_path(grid, size, size, 0, 0, g, g))
+        results[f"has_path.distance_field.{size}x{size}"] = measure(lambda: compute_distance_field(grid, 0, 0))
+    return results
+
+def main():
+    print_results(collect())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""미로 생성 시간 측정 (maze.generate_maze, 20x20 ~ 2000x2000)
+
+실행: (code/ 폴더에서) python -m benchmarks.maze_gen [크기 ...]
+"""
+import sys
+
+from maze import generate_maze
+from benchmarks.timing import measure, print_results
+
+SIZES = [20, 100, 500, 2000]
+QUICK_SIZES = [20, 100]
+
+def collect(quick=False, sizes=None):
+    sizes = sizes or (QUICK_SIZES if quick else SIZES)
+    results = {}
+    for size in sizes:
+        big = size >= 500  # 큰 미로는 한 번에 몇 초씩 걸리므로 반복 횟수를 줄인다
+        results[f"generate_maze.{size}x{size}"] = measure(
+            lambda: generate_maze(size, size, 1),
+            min_runs=1 if big else 3, warmup=not big)
+    return results
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    print_results(collect(sizes=[int(a) for a in argv] or None))
+
+if __name__ == "__main__":
+    main()
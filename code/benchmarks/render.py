@@ -0,0 +1,50 @@
+"""그리기 비용 측정 (화면 없이 오프스크린 Surface, SDL dummy 드라이버)
+- maze_layer: 미로 벽 레이어 새로 그리기 (미로/셀 크기가 바뀔 때만 발생)
+- wall_segments: 벽 선분 목록 만들기 (미로마다 한 번, 이후 캐시)
+- draw_maze: 캐시된 레이어로 미로 그리기 (매 프레임 비용)
+- draw_debuff_hud: HUD 그리기
+
+실행: (code/ 폴더에서) python -m benchmarks.render
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from maze import generate_maze
+from renderer import draw_maze, draw_debuff_hud, build_maze_layer
+from wall_geometry import build_wall_segments
+from debuff import DebuffState
+from benchmarks.timing import measure, print_results
+
+# (미로 크기, 셀 크기): EASY, HARD, 큰 미로
+CASES = [(20, 60), (30, 50), (100, 10)]
+
+def collect(quick=False):
+    pygame.init()
+    results = {}
+    for size, cell in CASES:
+        grid = generate_maze(size, size, 1, packed=True)
+        surface = pygame.Surface((size * cell, size * cell))
+        goal = size - 1
+        results[f"maze_layer.{size}x{size}"] = measure(lambda: build_maze_layer(grid, cell, goal, goal))
+        results[f"wall_segments.{size}x{size}"] = measure(lambda: build_wall_segments(grid))
+        results[f"draw_maze.{size}x{size}"] = measure(lambda: draw_maze(surface, grid, cell, goal, goal))
+
+    surface = pygame.Surface((1200, 1200))
+    font = pygame.font.Font(None, 24)
+    debuffs = DebuffState()
+    debuffs.slow_until_ms = debuffs.reverse_until_ms = 60_000
+    now = [0]
+    def hud():
+        # 남은 시간 글자가 매번 바뀌는 최악 상황 (1초씩 흐른다고 가정)
+        now[0] += 1000
+        draw_debuff_hud(surface, debuffs, now[0] % 60_000, 180_000 - now[0] % 180_000, font, 3)
+    results["draw_debuff_hud"] = measure(hud)
+    return results
+
+def main():
+    print_results(collect())
+
+if __name__ == "__main__":
+    main()
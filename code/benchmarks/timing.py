@@ -0,0 +1,35 @@
+"""벤치마크 공통 시간 측정 도우미"""
+import time
+
+def measure(fn, min_time=0.5, min_runs=3, max_runs=1000, warmup=True):
+    """fn()을 min_time 초 이상 (최소 min_runs 번) 반복 실행해서 ms 단위 통계 반환
+    warmup이면 캐시/지연 초기화 영향을 빼려고 한 번 먼저 돌리고 버린다"""
+    if warmup:
+        fn()
+    times = []
+    total = 0.0
+    while len(times) < max_runs and (len(times) < min_runs or total < min_time):
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        times.append(dt)
+        total += dt
+    return summarize(times)
+
+def summarize(times):
+    """초 단위 측정값 목록 -> {"median_ms", "mean_ms", "min_ms", "p95_ms", "runs"}"""
+    times = sorted(times)
+    n = len(times)
+    return {
+        "median_ms": times[n // 2] * 1000,
+        "mean_ms": sum(times) / n * 1000,
+        "min_ms": times[0] * 1000,
+        "p95_ms": times[min(n - 1, int(n * 0.95))] * 1000,
+        "runs": n,
+    }
+
+def print_results(results):
+    width = max([34] + [len(name) for name in results])
+    print(f"{'benchmark':<{width}} {'median(ms)':>11} {'p95(ms)':>10} {'runs':>6}")
+    for name, r in results.items():
+        print(f"{name:<{width}} {r['median_ms']:>11.3f} {r['p95_ms']:>10.3f} {r['runs']:>6}")
@@ -1,8 +1,11 @@
-import pygame
+try:
+    import pygame
+except ImportError:
+    pygame = None  # 그리기 없이 game_state 코어만 쓸 때 (헤드리스 실행)
 import math
 
 class Boss:
-    def __init__(self, x, y, cell_size, max_hp=5):
+    def __init__(self, x, y, cell_size, max_hp=5, speed=0):
         # 1. 요청하신 속성 추가
         self.x = x          # 셀 좌표 x
         self.y = y          # 셀 좌표 y
@@ -14,6 +17,11 @@ class Boss:
         self.cell_size = cell_size
         self.pixel_x = x * cell_size
         self.pixel_y = y * cell_size
+
+        # 추격용 변수 (speed=0 이면 예전처럼 제자리)
+        self.speed = speed  # 프레임당 이동 픽셀
+        self.target_pixel_x = self.pixel_x
+        self.target_pixel_y = self.pixel_y
         
         # 애니메이션용 변수
         self.anim_timer = 0
@@ -28,29 +36,60 @@ class Boss:
             self.hp = 0
             self.is_alive = False
 
-    def update(self):
-        """살아있을 때만 애니메이션 재생"""
-        if self.is_alive:
-            self.anim_timer += 0.1
+    def update(self, flow=None):
+        """살아있을 때만 애니메이션 재생
+        flow(pathfinding.FlowField)를 주면 칸 단위로 플레이어 쪽을 향해 이동"""
+        if not self.is_alive:
+            return
+        self.anim_timer += 0.1
+        if flow is None or self.speed <= 0:
+            return
+
+        # 칸 한가운데 도착했을 때만 다음 칸을 정한다 (셀 좌표는 이동 시작 때 갱신)
+        if self.pixel_x == self.target_pixel_x and self.pixel_y == self.target_pixel_y:
+            step = flow.next_step(self.x, self.y)
+            if step is None:
+                return
+            self.x, self.y = step
+            self.target_pixel_x = self.x * self.cell_size
+            self.target_pixel_y = self.y * self.cell_size
+
+        if self.pixel_x < self.target_pixel_x:
+            self.pixel_x = min(self.pixel_x + self.speed, self.target_pixel_x)
+        elif self.pixel_x > self.target_pixel_x:
+            self.pixel_x = max(self.pixel_x - self.speed, self.target_pixel_x)
+        if self.pixel_y < self.target_pixel_y:
+            self.pixel_y = min(self.pixel_y + self.speed, self.target_pixel_y)
+        elif self.pixel_y > self.target_pixel_y:
+            self.pixel_y = max(self.pixel_y - self.speed, self.target_pixel_y)
 
-    def draw(self, surface):
+    def draw(self, surface, view=None, pos=None):
+        """그린 영역(본체 + HP 바)을 Rect로 반환
+        view(renderer.View)가 있으면 창 해상도 좌표/크기로 변환해서 그림
+        pos를 주면 pixel_x/y 대신 그 위치(보간된 픽셀 좌표)에 그림"""
         # 죽었으면 그리지 않음
         if not self.is_alive:
-            return
+            return None
+
+        x, y = pos if pos is not None else (self.pixel_x, self.pixel_y)
+        cell_size, scale = self.cell_size, 1
+        if view is not None:
+            x, y = view.to_screen(x, y)
+            cell_size, scale = view.cell_size, view.scale
 
         # 1. 보스 본체 그리기 (기존 코드와 동일)
-        pulse = math.sin(self.anim_timer) * 2
-        rect_size = self.cell_size - 8 + pulse
-        offset = (self.cell_size - rect_size) / 2
+        pulse = math.sin(self.anim_timer) * 2 * scale
+        rect_size = cell_size - 8 * scale + pulse
+        offset = (cell_size - rect_size) / 2
         
         rect = pygame.Rect(
-            self.pixel_x + offset, 
-            self.pixel_y + offset, 
+            x + offset, 
+            y + offset, 
             rect_size, 
             rect_size
         )
         
-        pygame.draw.rect(surface, (200, 0, 0), rect, border_radius=5)
+        pygame.draw.rect(surface, (200, 0, 0), rect, border_radius=max(1, round(5 * scale)))
         
         # 눈 그리기
         eye_radius = rect_size / 6
@@ -61,13 +100,14 @@ class Boss:
         pygame.draw.circle(surface, (255, 255, 0), (int(rect.right - eye_offset_x), int(rect.y + eye_offset_y)), int(eye_radius))
 
         # 2. HP 바 그리기 (머리 위)
-        self._draw_health_bar(surface)
+        bar_rect = self._draw_health_bar(surface, x, y, cell_size, scale)
+        return rect.union(bar_rect)
 
-    def _draw_health_bar(self, surface):
-        bar_width = self.cell_size
-        bar_height = 6
-        bar_x = self.pixel_x
-        bar_y = self.pixel_y - 10  # 보스 머리 위 10픽셀
+    def _draw_health_bar(self, surface, x, y, cell_size, scale=1):
+        bar_width = cell_size
+        bar_height = max(2, round(6 * scale))
+        bar_x = x
+        bar_y = y - round(10 * scale)  # 보스 머리 위 10픽셀
 
         # 체력 비율 계산
         ratio = self.hp / self.max_hp
@@ -80,4 +120,5 @@ class Boss:
         # 체력 (초록색 ~ 빨간색 그라데이션 대신 단순 초록/빨강 처리)
         color = (0, 255, 0) if ratio > 0.3 else (255, 0, 0)
         fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-        pygame.draw.rect(surface, color, fill_rect)
\ No newline at end of file
+        pygame.draw.rect(surface, color, fill_rect)
+        return bg_rect
\ No newline at end of file
@@ -1,6 +1,6 @@
 import random
 from enum import Enum
-from collections import deque
+from pathfinding import compute_distance_field
 
 N, S, E, W = 1, 2, 4, 8
 DX = {E: 1, W: -1, N: 0, S: 0}
@@ -33,24 +33,12 @@ class DebuffState:
     def time_left(self, now_ms, until_ms):
         return max(0, int((until_ms - now_ms)/1000))
 
-# ===== 경로 유지 확인용 BFS =====
+# ===== 경로 유지 확인 =====
 def has_path(grid, w, h, sx, sy, gx, gy):
-    q = deque()
-    q.append((sx, sy))
-    seen = [[False]*w for _ in range(h)]
-    seen[sy][sx] = True
-    while q:
-        x, y = q.popleft()
-        if (x, y) == (gx, gy):
-            return True
-        cell = grid[y][x]
-        for d in (N, S, E, W):
-            if cell & d:
-                nx, ny = x + DX[d], y + DY[d]
-                if 0 <= nx < w and 0 <= ny < h and not seen[ny][nx]:
-                    q.append((nx, ny))
-                    seen[ny][nx] = True
-    return False
+    # 평면 배열 BFS, 도착점을 꺼내면 바로 멈춤 (매번 새로 계산하므로 격자를 바꾼 뒤에도 정확)
+    if (w, h) != (len(grid[0]), len(grid)):
+        raise ValueError(f"w, h가 격자 크기와 다릅니다 ({w}x{h} != {len(grid[0])}x{len(grid)})")
+    return compute_distance_field(grid, sx, sy, stop=(gx, gy)).reachable(gx, gy)
 
 # ===== 출발지점 인접 랜덤 스폰 =====
 def spawn_debuff_near_start(grid, w, h, rng, start=(0,0)):
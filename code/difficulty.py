@@ -1,28 +1,38 @@
 import sys
-import pygame
+try:
+    import pygame
+    from render_cache import render_text
+except ImportError:
+    pygame = None  # 헤드리스 실행에서는 EASY/HARD 값만 사용
 
 FONT_NAME = "malgungothic"  # 폰트 없으면 None으로 fallback
 MENU_FONT_SIZE = 25
 
 class Difficulty:
     # [수정] name 파라미터 추가
-    def __init__(self, width, height, cell, time_limit, name):
+    def __init__(self, width, height, cell, time_limit, name, target=None, generator="kruskal"):
         self.width = width
         self.height = height
         self.cell = cell
         self.time_limit = time_limit
         self.name = name  # [수정] 난이도 이름 저장
+        # 미로 지표 목표 구간 {지표: (최소, 최대)}, seed 은행(seed_bank.py)이 있으면 이 구간의 seed만 사용
+        self.target = target
+        # 미로 생성 알고리즘 (maze.GENERATORS 이름), 속도/지표 비교는 python -m benchmarks.generators
+        self.generator = generator
 
 # [수정] 객체 생성 시 name 지정
 # (EASY: 20x20, 셀 60px, 창 1200x1200)
-EASY = Difficulty(width=20, height=20, cell=60, time_limit=180, name="Easy") 
+EASY = Difficulty(width=20, height=20, cell=60, time_limit=180, name="Easy",
+                  target={"solution_length": (45, 80)})
 # (HARD: 30x30, 셀 50px, 창 1500x1500)
-HARD = Difficulty(width=30, height=30, cell=50, time_limit=300, name="Hard") 
+HARD = Difficulty(width=30, height=30, cell=50, time_limit=300, name="Hard",
+                  target={"solution_length": (80, 130), "boss_distance": (20, None)})  # 보스가 출발점 바로 옆이면 너무 가혹
 
 def _draw_button(screen, rect, text, font, color=(200,200,200), text_color=(0,0,0)):
     pygame.draw.rect(screen, color, rect)
     pygame.draw.rect(screen, (0,0,0), rect, 2)
-    surf = font.render(text, True, text_color)
+    surf = render_text(font, text, True, text_color)
     screen.blit(surf, surf.get_rect(center=rect.center))
 
 def select_difficulty():
@@ -0,0 +1,300 @@
+"""화면 없이 돌아가는 게임 규칙 코어 (pygame 임포트 없음)
+
+- GameState(difficulty, seed): 미로/플레이어/보스/아이템/타이머 등 한 세션의 상태
+- step(state, inputs, dt_ms): 입력 목록을 처리하고 dt_ms 만큼 시간을 진행
+시간은 state.now_ms(세션 시작부터 흐른 게임 시간)만 쓰고, 호출하는 쪽이 dt_ms로 넣어 준다.
+pygame 클라이언트는 FixedTimestep으로 프레임 시간을 STEP_MS 간격 step 여러 번으로 나눠 돌리고,
+두 step 사이는 player_render_pos/boss_render_pos로 보간해서 그린다.
+(일시정지 중에는 step을 부르지 않으면 타이머와 디버프 시간이 같이 멈춘다)."""
+import random
+from maze import N, S, E, W
+from maze_cache import get_maze
+from player import Player
+from boss import Boss
+from debuff import DebuffType, DebuffState, DebuffItem, spawn_debuff_near_start
+from items import ItemStore, DEBUFF, ATTACK
+from placement import session_sampler
+from pathfinding import FlowField, compute_distance_field
+from wall_geometry import build_wall_segments
+
+SLOW_DURATION_MS = 30_000
+REVERSE_DURATION_MS = 15_000
+TIME_LEFT_MS = 15_000
+
+MAX_DEBUFF_ITEMS = 25
+ATTACK_ITEM_COUNT = 5
+BOSS_SPEED_DIV = 20  # 보스 추격 속도 = cell_size // 20 (플레이어는 cell_size // 8)
+BOSS_WARNING_MS = 2000
+
+# 고정 시간 간격 시뮬레이션: 화면 주사율과 상관없이 규칙은 항상 60Hz로 진행
+# (플레이어/보스 속도는 step 한 번당 픽셀이라 step 간격이 바뀌면 게임 속도가 바뀐다)
+STEP_MS = 1000 / 60
+MAX_STEPS_PER_FRAME = 5  # 한 프레임이 너무 길면 그 이상은 버림 (느린 PC에서 따라잡기만 하다 멈추는 것 방지)
+
+# 입력 (키 이벤트 하나 = 입력 하나)
+UP, DOWN, LEFT, RIGHT, ATTACK_KEY = "up", "down", "left", "right", "attack"
+MOVE_DIRS = {UP: N, DOWN: S, LEFT: W, RIGHT: E}
+REVERSED_DIRS = {UP: S, DOWN: N, LEFT: E, RIGHT: W}
+
+# 게임 종료 메시지
+TIME_OVER = "TIME OVER"
+CAUGHT = "CAUGHT BY BOSS"
+STAGE_CLEAR = "STAGE CLEAR!"
+
+def is_hard(difficulty):
+    return getattr(difficulty, 'name', '') in ["Hard", "어려움"]
+
+class GameState:
+    """한 세션의 게임 상태 (같은 difficulty/seed면 항상 같은 배치)
+    grid를 주면 미로 생성을 건너뛴다 (미리 만들어 둔 미로 재사용용)"""
+    def __init__(self, difficulty, seed, grid=None):
+        width, height, cell_size = difficulty.width, difficulty.height, difficulty.cell
+        self.difficulty = difficulty
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.time_limit_ms = difficulty.time_limit * 1000
+        self.hard = is_hard(difficulty)
+        rng = random.Random(seed)
+
+        self.generator = difficulty.generator
+        # 같은 seed면 캐시에서 바로 가져옴
+        self.grid = grid if grid is not None else get_maze(width, height, seed, self.generator)
+        self.goal_x, self.goal_y = width - 1, height - 1
+        self._distance_fields = {}  # source 칸 -> DistanceField (distance_field() 참고)
+        self._wall_segments = None  # wall_segments() 참고
+
+        self.base_speed = max(1, cell_size // 8)
+        player = Player(0, 0, speed=cell_size // 8)
+        player.pixel_x = player.grid_x * cell_size
+        player.pixel_y = player.grid_y * cell_size
+        player.target_pixel_x = player.pixel_x
+        player.target_pixel_y = player.pixel_y
+        self.player = player
+
+        # 빈 칸 뽑기 (출발점/도착점 제외, 한 번 뽑힌 칸은 다시 안 나옴)
+        sampler = session_sampler(rng, width, height)
+
+        self.boss = None
+        self.boss_flow = None
+        if self.hard:
+            bx, by = sampler.take()  # 맨 처음 뽑는 칸 (placement.boss_spawn_cell 과 같아야 함)
+            self.boss = Boss(bx, by, cell_size, max_hp=5, speed=max(1, cell_size // BOSS_SPEED_DIV))
+            self.boss_flow = FlowField(self.grid)  # 플레이어 쪽 흐름장 (보스 여러 마리가 같이 사용 가능)
+        self.attack_charges = 0
+
+        # 디버프/공격 아이템은 칸 단위 인덱스에 함께 저장 (픽업 검사 O(1))
+        self.items = items = ItemStore(width, height)
+
+        self.debuff_state = DebuffState()
+        start_item = spawn_debuff_near_start(self.grid, width, height, rng, start=(0, 0))
+        sampler.exclude(start_item.gx, start_item.gy)
+        items.add(start_item.gx, start_item.gy, DEBUFF, start_item)
+
+        if self.hard:
+            for ax, ay in sampler.take_many(ATTACK_ITEM_COUNT):
+                items.add(ax, ay, ATTACK)
+
+        remaining_slots = max(0, MAX_DEBUFF_ITEMS - items.count(DEBUFF))
+        target_item_count = min(remaining_slots, int(width * height * 0.05))
+
+        for _ in range(target_item_count):
+            cell = sampler.take()
+            if cell is None:
+                break  # 빈 칸이 모자라면 있는 만큼만 배치
+            rx, ry = cell
+            dtype = rng.choice([DebuffType.SLOW, DebuffType.TIME_LEFT, DebuffType.REVERSE])
+            items.add(rx, ry, DEBUFF, DebuffItem(rx, ry, dtype))
+
+        self.steps = 0              # 지금까지 진행한 step 수 (리플레이 입력 시각 기준)
+        self.now_ms = 0             # 세션 시작부터 흐른 게임 시간
+        self.elapsed_ms = 0         # 타이머 기준 경과 시간 (TIME_LEFT 디버프만큼 앞당겨짐)
+        self.remaining_time_ms = self.time_limit_ms
+        self.game_over_message = ""
+        self.boss_warning_msg = ""
+        self.boss_warning_until_ms = 0
+
+        # 직전 step 시작 시점의 픽셀 위치 (그리기 보간용)
+        self.prev_player_pos = (player.pixel_x, player.pixel_y)
+        self.prev_boss_pos = (self.boss.pixel_x, self.boss.pixel_y) if self.boss else None
+
+    @property
+    def is_over(self):
+        return self.game_over_message != ""
+
+    @property
+    def won(self):
+        return self.game_over_message == STAGE_CLEAR
+
+    def distance_field(self, sx, sy):
+        """이 세션 미로에서 (sx, sy) 기준 거리장, source마다 처음 한 번만 계산해서 세션에 보관
+        (세션 격자는 미로 캐시와 공유하는 읽기 전용이라 바뀌지 않음, 세션이 끝나면 같이 사라짐)"""
+        field = self._distance_fields.get((sx, sy))
+        if field is None:
+            field = self._distance_fields[(sx, sy)] = compute_distance_field(self.grid, sx, sy)
+        return field
+
+    def wall_segments(self):
+        """이 세션 미로의 벽 선분 (처음 한 번만 계산, prefetch 작업 스레드가 미리 불러 둔다)"""
+        if self._wall_segments is None:
+            self._wall_segments = build_wall_segments(self.grid)
+        return self._wall_segments
+
+def apply_input(state, action):
+    """입력 하나 처리 (이동 시작 또는 보스 공격)"""
+    if action == ATTACK_KEY:
+        boss = state.boss
+        if state.attack_charges > 0 and boss and boss.is_alive:
+            px, py = state.player.grid_x, state.player.grid_y
+            if abs(px - boss.x) + abs(py - boss.y) <= 1:  # 같은 칸이거나 바로 옆 칸
+                boss.take_damage(1)
+                state.attack_charges -= 1
+        return
+    dirs = REVERSED_DIRS if state.debuff_state.is_reverse(state.now_ms) else MOVE_DIRS
+    direction = dirs.get(action)
+    if direction is not None:
+        state.player.start_move(state.grid, direction, state.cell_size)
+
+def step(state, inputs, dt_ms):
+    """dt_ms 만큼 시간을 진행하고 inputs(이번 step 입력 목록)를 처리, 끝난 세션은 그대로 둔다"""
+    if state.game_over_message:
+        return state
+    player, boss = state.player, state.boss
+    state.prev_player_pos = (player.pixel_x, player.pixel_y)
+    if boss is not None:
+        state.prev_boss_pos = (boss.pixel_x, boss.pixel_y)
+
+    state.steps += 1
+    state.now_ms += dt_ms
+    now_ms = state.now_ms
+    for action in inputs:
+        apply_input(state, action)
+
+    state.elapsed_ms += dt_ms
+    state.remaining_time_ms = max(0, state.time_limit_ms - state.elapsed_ms)
+    if state.remaining_time_ms <= 0:
+        state.game_over_message = TIME_OVER
+
+    if boss and boss.is_alive:
+        # 플레이어가 다른 칸으로 옮겼을 때만 흐름장 재계산, 한 프레임에 budget 칸까지만
+        state.boss_flow.set_target(player.grid_x, player.grid_y)
+        state.boss_flow.update()
+        boss.update(state.boss_flow)
+        half = state.cell_size / 2
+        if abs(player.pixel_x - boss.pixel_x) < half and abs(player.pixel_y - boss.pixel_y) < half:
+            state.game_over_message = CAUGHT
+
+    # 아이템 처리: 플레이어가 있는 칸만 O(1)로 확인
+    picked = state.items.pop(player.grid_x, player.grid_y)
+    if picked is not None:
+        kind, it = picked
+        if kind == ATTACK:
+            state.attack_charges += 1
+        elif kind == DEBUFF:
+            debuffs = state.debuff_state
+            if it.dtype == DebuffType.SLOW:
+                debuffs.slow_until_ms = max(now_ms, debuffs.slow_until_ms) + SLOW_DURATION_MS
+            elif it.dtype == DebuffType.REVERSE:
+                debuffs.reverse_until_ms = max(now_ms, debuffs.reverse_until_ms) + REVERSE_DURATION_MS
+            elif it.dtype == DebuffType.TIME_LEFT:
+                # 남은 시간을 줄이고 경과 시간을 그만큼 앞당겨 타이머 일관성 유지
+                state.remaining_time_ms = max(0, state.remaining_time_ms - TIME_LEFT_MS)
+                state.elapsed_ms = state.time_limit_ms - state.remaining_time_ms
+
+    if state.debuff_state.is_slow(now_ms):
+        player.speed = max(1, int(state.base_speed * state.debuff_state.slow_multiplier))
+    else:
+        player.speed = state.base_speed
+    player.update()
+
+    if player.grid_x == state.goal_x and player.grid_y == state.goal_y:
+        if state.hard and boss is not None and boss.is_alive:
+            state.boss_warning_msg = "clear boss first!"
+            state.boss_warning_until_ms = now_ms + BOSS_WARNING_MS
+        else:
+            state.game_over_message = STAGE_CLEAR
+    return state
+
+def skip_idle(state, max_steps, dt_ms=STEP_MS):
+    """아무것도 움직이지 않는 동안(플레이어 정지, 살아 있는 보스 없음)은 타이머만 흐르므로
+    step() 없이 시간만 빠르게 진행한다. 결과는 step(state, [], dt_ms)를 같은 횟수만큼 부른 것과 같다.
+    최대 max_steps 만큼 진행하고 실제로 진행한 step 수 반환 (멈춰 있지 않으면 0)"""
+    player, boss = state.player, state.boss
+    if (state.game_over_message or player.moving_direction is not None
+            or (boss is not None and boss.is_alive)
+            or (player.grid_x, player.grid_y) in state.items
+            or (player.grid_x == state.goal_x and player.grid_y == state.goal_y)):
+        return 0
+    state.prev_player_pos = (player.pixel_x, player.pixel_y)
+    if boss is not None:
+        state.prev_boss_pos = (boss.pixel_x, boss.pixel_y)
+
+    now_ms, elapsed_ms, limit_ms = state.now_ms, state.elapsed_ms, state.time_limit_ms
+    n = 0
+    while n < max_steps:
+        # step()과 똑같은 순서로 더해야 부동소수 누적 결과가 같다
+        now_ms += dt_ms
+        elapsed_ms += dt_ms
+        n += 1
+        if limit_ms - elapsed_ms <= 0:
+            state.game_over_message = TIME_OVER
+            break
+    state.steps += n
+    state.now_ms, state.elapsed_ms = now_ms, elapsed_ms
+    state.remaining_time_ms = max(0, limit_ms - elapsed_ms)
+    if n and state.debuff_state.is_slow(now_ms):
+        player.speed = max(1, int(state.base_speed * state.debuff_state.slow_multiplier))
+    elif n:
+        player.speed = state.base_speed
+    return n
+
+def _lerp(prev, x, y, alpha):
+    return prev[0] + (x - prev[0]) * alpha, prev[1] + (y - prev[1]) * alpha
+
+def player_render_pos(state, alpha):
+    """직전 step과 현재 step 사이를 alpha(0~1)만큼 보간한 플레이어 픽셀 위치"""
+    p = state.player
+    return _lerp(state.prev_player_pos, p.pixel_x, p.pixel_y, alpha)
+
+def boss_render_pos(state, alpha):
+    b = state.boss
+    return _lerp(state.prev_boss_pos, b.pixel_x, b.pixel_y, alpha)
+
+class FixedTimestep:
+    """프레임 시간(ms)을 모아서 고정 간격 step 몇 번을 돌릴지 알려 주는 누산기
+    - advance(frame_ms): 이번 프레임에 돌릴 step 수 (남은 시간은 다음 프레임으로 이월)
+    - alpha: 이월된 시간 / step 간격 -> 그리기 보간 비율"""
+    def __init__(self, step_ms=STEP_MS, max_steps=MAX_STEPS_PER_FRAME):
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0  # 따라잡지 못한 시간은 버린다 (그만큼 게임이 느려짐)
+        else:
+            self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step_ms)
+
+    def reset(self):
+        self.accumulator = 0.0
+
+def run_session(difficulty, seed, controller, dt_ms=STEP_MS, max_steps=None):
+    """화면 없이 세션 하나를 끝까지 돌린다 (테스트/밸런스 조정용)
+    controller(state)는 매 step 입력 목록을 돌려준다. 끝난 GameState 반환"""
+    state = GameState(difficulty, seed)
+    steps = 0
+    while not state.game_over_message:
+        if max_steps is not None and steps >= max_steps:
+            break
+        step(state, controller(state), dt_ms)
+        steps += 1
+    return state
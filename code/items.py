@@ -0,0 +1,74 @@
+# 아이템 종류
+DEBUFF = "debuff"        # DebuffItem (밟으면 디버프)
+ATTACK = "attack"        # 공격 아이템 (보스 공격 횟수 +1)
+BOSS_DROP = "boss_drop"  # 보스가 떨어뜨리는 아이템 (예정)
+
+class ItemStore:
+    """미로 칸 단위로 아이템을 저장하는 공간 인덱스 (키: y * width + x)
+    - 칸 하나에 아이템 하나, 종류(kind)와 상관없이 한 곳에서 관리
+    - 조회/줍기(pop)는 O(1) 이라서 아이템이 수천 개여도 픽업 검사 비용이 일정하다"""
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._cells = {}  # 칸 인덱스 -> (kind, item)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __contains__(self, pos):
+        x, y = pos
+        return y * self.width + x in self._cells
+
+    def add(self, x, y, kind, item=None):
+        idx = y * self.width + x
+        if idx in self._cells:
+            raise ValueError(f"({x}, {y}) 칸에 이미 아이템이 있습니다")
+        self._cells[idx] = (kind, item)
+
+    def get(self, x, y):
+        """(kind, item) 또는 None"""
+        return self._cells.get(y * self.width + x)
+
+    def pop(self, x, y):
+        """칸의 아이템을 꺼내서 (kind, item) 반환, 없으면 None"""
+        return self._cells.pop(y * self.width + x, None)
+
+    def count(self, kind=None):
+        if kind is None:
+            return len(self._cells)
+        return sum(1 for k, _ in self._cells.values() if k == kind)
+
+    def iter_items(self, kind=None):
+        """(x, y, kind, item) 순회"""
+        w = self.width
+        for idx, (k, item) in self._cells.items():
+            if kind is None or k == kind:
+                yield idx % w, idx // w, k, item
+
+    def iter_in_rect(self, x0, y0, x1, y1, kind=None):
+        """[x0, x1) x [y0, y1) 범위(화면에 보이는 칸 등) 안의 아이템만 (x, y, kind, item) 순회"""
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width, x1), min(self.height, y1)
+        if x1 <= x0 or y1 <= y0:
+            return
+        if (x1 - x0) * (y1 - y0) >= len(self._cells):
+            # 범위가 아이템 수보다 넓으면 아이템 쪽을 훑는 편이 빠름
+            for x, y, k, item in self.iter_items(kind):
+                if x0 <= x < x1 and y0 <= y < y1:
+                    yield x, y, k, item
+            return
+        cells = self._cells
+        for y in range(y0, y1):
+            row = y * self.width
+            for x in range(x0, x1):
+                entry = cells.get(row + x)
+                if entry is not None and (kind is None or entry[0] == kind):
+                    yield x, y, entry[0], entry[1]
+
+    def values(self, kind=None):
+        for _, _, _, item in self.iter_items(kind):
+            yield item
+
+    def positions(self, kind=None):
+        for x, y, _, _ in self.iter_items(kind):
+            yield x, y
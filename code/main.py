@@ -1,30 +1,106 @@
+import os
 import sys
+import time
 import pygame
-import random
 from difficulty import select_difficulty
-from maze import generate_maze, N, S, E, W
-from player import Player
-from renderer import draw_maze, draw_debuff_items, draw_debuff_hud
-from debuff import (
-    DebuffType, DebuffState, DebuffItem, spawn_debuff_near_start,
-    apply_debuff_on_pickup
+from renderer import (
+    draw_maze_view, draw_debuff_items, draw_attack_items, draw_debuff_hud,
+    DirtyRectTracker, follow_view, draw_profiler_overlay
+)
+from items import DEBUFF, ATTACK
+from game_state import (
+    step, FixedTimestep, STEP_MS, player_render_pos, boss_render_pos,
+    UP, DOWN, LEFT, RIGHT, ATTACK_KEY
 )
-from boss import Boss
 
 # [추가] 분리한 메뉴 파일 임포트
 import menu 
-
-SLOW_DURATION_MS = 30_000       
-REVERSE_DURATION_MS = 15_000    
-TIME_LEFT_MS = 15_000          
-
-MAX_DEBUFF_ITEMS = 25
-ATTACK_ITEM_COUNT = 5
+from render_cache import render_text, get_box
+from replay import ReplayRecorder, save_replay
+from prefetch import SessionPrefetcher
+from profiler import FrameProfiler
+
+# 키 -> 게임 입력 (반전 디버프 처리는 game_state.step 쪽에서)
+KEY_INPUTS = {
+    pygame.K_UP: UP, pygame.K_DOWN: DOWN,
+    pygame.K_LEFT: LEFT, pygame.K_RIGHT: RIGHT,
+    pygame.K_SPACE: ATTACK_KEY,
+}
+
+# 화면 갱신 상한 (게임 규칙은 game_state.STEP_MS 간격으로 따로 진행하므로 30/60/144 어느 값이어도 게임 속도는 같음)
+RENDER_FPS = 60
+
+# 처음 창 크기 상한 (모니터 크기 비율, 모니터 크기를 모르면 고정 크기)
+MAX_WINDOW_FRACTION = 0.9
+DEFAULT_MAX_WINDOW = (1280, 960)
+
+# 끝난 세션의 리플레이 저장 위치 (python replay.py play/verify 로 재생/검증)
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays")
+
+def save_session_replay(recorder, state):
+    try:
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d_%H%M%S')}_{state.seed}.mrp"
+        save_replay(os.path.join(REPLAY_DIR, name), recorder.finish(state))
+    except OSError:
+        pass  # 저장 실패해도 게임은 계속
+
+# 프레임 프로파일러 (F3: 표시 켜기/끄기, F4: 최근 프레임을 Chrome trace/CSV로 저장)
+PROFILE_PHASES = ("wait", "events", "update", "maze", "sprites", "hud", "ui", "present")
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+
+def export_profile(profiler):
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, f"profile_{time.strftime('%Y%m%d_%H%M%S')}")
+        profiler.export_chrome_trace(base + ".json")
+        profiler.export_csv(base + ".csv")
+    except OSError:
+        pass
+
+def draw_world(screen, state, view, alpha, hud_font):
+    """미로 위에 올라가는 것들(아이템, 보스, 플레이어, HUD)을 그리고 그린 영역 목록 반환
+    (리플레이 재생 화면도 같이 사용)"""
+    rects = draw_sprites(screen, state, view, alpha)
+    rects.append(draw_hud(screen, state, hud_font))
+    return rects
+
+def draw_sprites(screen, state, view, alpha):
+    items, boss = state.items, state.boss
+    # 창에 보이는 칸 안의 것만 그림 (카메라 모드에서 미로가 커도 그리기 비용 일정)
+    x0, y0, x1, y1 = view.visible_cells(state.width, state.height)
+    rects = []
+    rects += draw_debuff_items(screen, (it for _, _, _, it in items.iter_in_rect(x0, y0, x1, y1, DEBUFF)),
+                               view.cell_size, view.origin)
+    rects += draw_attack_items(screen, ((x, y) for x, y, _, _ in items.iter_in_rect(x0, y0, x1, y1, ATTACK)),
+                               view.cell_size, view.origin)
+
+    if boss and boss.is_alive:
+        pos = boss_render_pos(state, alpha)
+        bx, by = pos[0] / state.cell_size, pos[1] / state.cell_size  # 칸 단위 (이동 중이면 소수)
+        if x0 - 1 < bx < x1 and y0 - 1 < by < y1:
+            rects.append(boss.draw(screen, view, pos))
+    rects.append(state.player.draw(screen, state.cell_size, view, player_render_pos(state, alpha)))
+    return rects
+
+def draw_hud(screen, state, hud_font):
+    return draw_debuff_hud(screen, state.debuff_state, state.now_ms, state.remaining_time_ms, hud_font, state.attack_charges)
+
+def camera_focus(state, alpha):
+    """카메라가 따라갈 위치: 그려지는(보간된) 플레이어 칸의 중심 (논리 좌표 픽셀)"""
+    x, y = player_render_pos(state, alpha)
+    return x + state.cell_size / 2, y + state.cell_size / 2
+
+def initial_window_size(maze_px_w, maze_px_h):
+    """미로 크기만큼의 창, 단 모니터보다 크면 모니터 안으로 줄임 (큰 미로는 카메라로 따라감)"""
+    info = pygame.display.Info()
+    max_w = int(info.current_w * MAX_WINDOW_FRACTION) if info.current_w > 0 else DEFAULT_MAX_WINDOW[0]
+    max_h = int(info.current_h * MAX_WINDOW_FRACTION) if info.current_h > 0 else DEFAULT_MAX_WINDOW[1]
+    return min(maze_px_w, max_w), min(maze_px_h, max_h)
 
 def main():
     difficulty = select_difficulty()
     width, height, cell_size = difficulty.width, difficulty.height, difficulty.cell
-    TIME_LIMIT_SECONDS = difficulty.time_limit
 
     pygame.init()
     
@@ -35,142 +111,81 @@ def main():
     
     clock = pygame.time.Clock()
 
-    game_width = width * cell_size
-    game_height = height * cell_size
+    game_width, game_height = initial_window_size(width * cell_size, height * cell_size)
 
     window_surface = pygame.display.set_mode((game_width, game_height), pygame.RESIZABLE)
     pygame.display.set_caption("Maze Game") 
-    game_surface = pygame.Surface((game_width, game_height))
+
+    # 창 해상도 그대로 그리기: 셀 크기/배치는 창 크기에서 매 프레임 계산 (renderer.follow_view)
+    # 미로가 창에 다 들어가면 가운데 고정, 너무 크면 플레이어를 따라가는 카메라
+    # 예전처럼 고정 크기 화면을 매 프레임 transform.scale 하지 않는다
+    view = None
 
     # 우상단 일시정지(메뉴) 버튼 영역
-    pause_btn_rect = pygame.Rect(game_width - 80, 10, 70, 30)
+    pause_btn_rect = pygame.Rect(window_surface.get_width() - 80, 10, 70, 30)
+
+    # 움직인 부분만 다시 그리는 더티 렉트 모드
+    dirty_tracker = DirtyRectTracker()
+
+    profiler = FrameProfiler(PROFILE_PHASES)
+
+    # 프레임 시간을 고정 간격 step으로 나눠 주는 누산기
+    timestep = FixedTimestep()
+
+    # 세션을 하는 동안 다음 세션(미로/배치/벽 선분)을 작업 스레드에서 미리 만들어 둔다
+    prefetcher = SessionPrefetcher(difficulty)
 
     while True: # 세션 루프
-        seed = random.randint(0, 999999)
-        rng = random.Random(seed)
+        # 게임 규칙/상태는 전부 game_state 코어에 있고, 여기서는 입력/그리기만 담당
+        # 재시작이면 미리 만든 세션으로 바로 교체 (첫 세션이나 준비가 덜 됐으면 여기서 생성)
+        state = prefetcher.take()
+        prefetcher.prefetch()
+        seed = state.seed
         pygame.display.set_caption(f"Maze Game (seed={seed})") 
+        grid, goal_x, goal_y = state.grid, state.goal_x, state.goal_y
 
-        grid = generate_maze(width, height, seed)
-
-        base_speed = max(1, cell_size // 8)
-        player = Player(0, 0, speed=cell_size // 8)
-        player.pixel_x = player.grid_x * cell_size
-        player.pixel_y = player.grid_y * cell_size
-        player.target_pixel_x = player.pixel_x
-        player.target_pixel_y = player.pixel_y
-
-        goal_x, goal_y = width - 1, height - 1
-
-        boss = None 
-        if getattr(difficulty, 'name', '') in ["Hard", "어려움"]:
-            while True:
-                bx = rng.randint(0, width - 1)
-                by = rng.randint(0, height - 1)
-                if (bx, by) != (0, 0) and (bx, by) != (goal_x, goal_y):
-                    boss = Boss(bx, by, cell_size, max_hp=5)
-                    break       
-        attack_charges = 0
-        attack_items = []
-
-        debuff_state = DebuffState()
-        debuff_items = []
-        start_item = spawn_debuff_near_start(grid, width, height, rng, start=(0, 0))
-        debuff_items.append(start_item)
-
-        occupied_positions = set()
-        occupied_positions.add((0, 0))
-        occupied_positions.add((goal_x, goal_y))
-        occupied_positions.add((start_item.gx, start_item.gy))
-        if boss and boss.is_alive:
-            occupied_positions.add((boss.x, boss.y))
-
-        attack_items = []
-        if getattr(difficulty, 'name', '') in ["Hard", "어려움"]:
-            for _ in range(ATTACK_ITEM_COUNT):
-                while True:
-                    ax = rng.randint(0, width - 1)
-                    ay = rng.randint(0, height - 1)
-                    if (ax, ay) not in occupied_positions:
-                        attack_items.append((ax, ay))
-                        occupied_positions.add((ax, ay))
-                        break
-
-        remaining_slots = MAX_DEBUFF_ITEMS - len(debuff_items)
-        if remaining_slots < 0:
-            remaining_slots = 0
-        target_item_count = min(remaining_slots, int(width * height * 0.05))
-
-        current_added = 0
-        while current_added < target_item_count:
-            rx = rng.randint(0, width - 1)
-            ry = rng.randint(0, height - 1)
-            if (rx, ry) not in occupied_positions:
-                dtype = rng.choice([DebuffType.SLOW, DebuffType.TIME_LEFT, DebuffType.REVERSE])
-                debuff_items.append(DebuffItem(rx, ry, dtype))
-                occupied_positions.add((rx, ry))
-                current_added += 1
-
-        start_time_ms = pygame.time.get_ticks()
-        remaining_time_ms = TIME_LIMIT_SECONDS * 1000
-        game_over_message = ""
         running = True
-        
         is_paused = False
-        pause_start_time = 0
         show_manual = False
-        
-        boss_warning_msg = ""
-        boss_warning_until_ms = 0
+        dirty_tracker.invalidate()  # 새 미로는 전체 다시 그리기
+        recorder = ReplayRecorder(state)
+        timestep.reset()
+        pending_inputs = []  # 아직 step에 넘기지 못한 입력 (이번 프레임에 step이 0번이면 다음 프레임으로)
+        clock.tick()  # 미로 생성에 걸린 시간은 게임 시간에 넣지 않음
 
         while running:
-            dt = clock.tick(60)
-            now_ms = pygame.time.get_ticks()
+            prof = profiler if profiler.enabled else None  # 꺼져 있으면 단계마다 None 확인만
+            if prof: prof.start_frame()
+            dt = clock.tick(RENDER_FPS)
+            if prof: prof.mark("wait")
 
             win_w, win_h = window_surface.get_size()
-            scale_x = game_width / win_w
-            scale_y = game_height / win_h
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            mouse_pos = (mouse_x * scale_x, mouse_y * scale_y)
+            mouse_pos = pygame.mouse.get_pos()  # 창 좌표 그대로 (스케일 보정 불필요)
 
-            is_menu_mode = is_paused or (game_over_message != "")
+            is_menu_mode = is_paused or state.is_over
 
             # ───────── 1. 이벤트 처리 ─────────
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
+                    prefetcher.close(); pygame.quit(); sys.exit()
                 elif event.type == pygame.VIDEORESIZE:
                     window_surface = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                    win_w, win_h = window_surface.get_size()
+                    pause_btn_rect = pygame.Rect(win_w - 80, 10, 70, 30)
+                    dirty_tracker.invalidate()
                 
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r: running = False
+                    elif event.key == pygame.K_F3: profiler.toggle()
+                    elif event.key == pygame.K_F4: export_profile(profiler)
                     
                     elif event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                         if show_manual: show_manual = False
-                        elif not game_over_message:
-                            is_paused = not is_paused
-                            if is_paused: pause_start_time = now_ms
-                            else: start_time_ms += (now_ms - pause_start_time)
+                        elif not state.is_over:
+                            is_paused = not is_paused  # 멈춘 동안은 step을 안 하므로 타이머도 멈춤
                     
-                    if not is_menu_mode and not show_manual:
-                        if debuff_state.is_reverse(now_ms):
-                            if event.key == pygame.K_UP: player.start_move(grid, S, cell_size)
-                            elif event.key == pygame.K_DOWN: player.start_move(grid, N, cell_size)
-                            elif event.key == pygame.K_LEFT: player.start_move(grid, E, cell_size)
-                            elif event.key == pygame.K_RIGHT: player.start_move(grid, W, cell_size)
-                        else:
-                            if event.key == pygame.K_UP: player.start_move(grid, N, cell_size)
-                            elif event.key == pygame.K_DOWN: player.start_move(grid, S, cell_size)
-                            elif event.key == pygame.K_LEFT: player.start_move(grid, W, cell_size)
-                            elif event.key == pygame.K_RIGHT: player.start_move(grid, E, cell_size)
-                        
-                        if event.key == pygame.K_SPACE:
-                            if attack_charges > 0 and boss and boss.is_alive:
-                                px, py = player.grid_x, player.grid_y
-                                bx, by = boss.x, boss.y
-
-                                if(px == bx and py == by) or abs(px - bx) + abs(py - by) == 1:
-                                    boss.take_damage(1)
-                                    attack_charges -= 1
+                    if not is_menu_mode and not show_manual and event.key in KEY_INPUTS:
+                        pending_inputs.append(KEY_INPUTS[event.key])
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1: # 좌클릭
@@ -178,7 +193,7 @@ def main():
                         # (A) 매뉴얼 닫기
                         if show_manual:
                             # 닫기 버튼 위치를 단순 계산 (그리기 로직과 맞춤)
-                            cx, cy = game_width // 2, game_height // 2
+                            cx, cy = win_w // 2, win_h // 2
                             back_rect = pygame.Rect(0, 0, 120, 45)
                             back_rect.center = (cx, cy + 225 - 50)
                             if back_rect.collidepoint(mouse_pos):
@@ -186,13 +201,12 @@ def main():
 
                         # (B) 메뉴 모드일 때 (버튼 로직을 menu.py의 get_menu_rects로 통합!)
                         elif is_menu_mode:
-                            cx, cy = game_width // 2, game_height // 2
+                            cx, cy = win_w // 2, win_h // 2
                             # [핵심] menu.py에서 버튼 위치를 받아옴 -> 좌표 불일치 해결!
-                            rects = menu.get_menu_rects(cx, cy, is_paused, game_over_message)
+                            rects = menu.get_menu_rects(cx, cy, is_paused, state.game_over_message)
                             
                             if 'resume' in rects and rects['resume'].collidepoint(mouse_pos):
                                 is_paused = False
-                                start_time_ms += (now_ms - pause_start_time)
                             
                             elif 'restart' in rects and rects['restart'].collidepoint(mouse_pos):
                                 running = False
@@ -201,150 +215,122 @@ def main():
                                 show_manual = True
                             
                             elif 'quit' in rects and rects['quit'].collidepoint(mouse_pos):
-                                pygame.quit(); sys.exit()
+                                prefetcher.close(); pygame.quit(); sys.exit()
 
                         # (C) 게임 중
                         else:
                             if pause_btn_rect.collidepoint(mouse_pos):
                                 is_paused = True
-                                pause_start_time = now_ms
 
             if not running: break
+            if prof: prof.mark("events")
 
             # ───────── 2. 게임 상태 업데이트 ─────────
+            # 프레임 시간과 상관없이 STEP_MS 간격으로 규칙을 진행 (느린 프레임이면 여러 번)
             if not is_menu_mode and not show_manual:
-                elapsed_ms = now_ms - start_time_ms
-                total_limit_ms = TIME_LIMIT_SECONDS * 1000
-                remaining_time_ms = max(0, total_limit_ms - elapsed_ms)
-                
-                if remaining_time_ms <= 0: game_over_message = "TIME OVER"
-                
-                if boss and boss.is_alive:
-                    boss.update()
-                    if abs(player.pixel_x - boss.pixel_x) < cell_size/2 and abs(player.pixel_y - boss.pixel_y) < cell_size/2:
-                        game_over_message = "CAUGHT BY BOSS"
-
-                # 추가. 공격 아이템 처리
-                if attack_items:
-                    next_attack_items = []
-                    for (ax, ay) in attack_items:
-                        if (player.grid_x, player.grid_y) == (ax, ay):
-                            attack_charges += 1
-                        else:
-                            next_attack_items.append((ax, ay))
-                    attack_items = next_attack_items
-                if debuff_items:
-                    next_items = []
-                    for it in debuff_items:
-                        if (player.grid_x, player.grid_y) == (it.gx, it.gy):
-                            if it.dtype == DebuffType.SLOW: debuff_state.slow_until_ms = max(now_ms, debuff_state.slow_until_ms) + SLOW_DURATION_MS
-                            elif it.dtype == DebuffType.REVERSE: debuff_state.reverse_until_ms = max(now_ms, debuff_state.reverse_until_ms) + REVERSE_DURATION_MS
-                            elif it.dtype == DebuffType.TIME_LEFT:
-                                elapsed_ms = now_ms - start_time_ms
-                                remaining_time_ms = max(0, total_limit_ms - elapsed_ms)
-
-                                # 30초 감소
-                                new_remaining_ms = max(0, remaining_time_ms - TIME_LEFT_MS)
-
-                                # start_time_ms 를 다시 계산해서 타이머 일관성 유지
-                                new_elapsed_ms = total_limit_ms - new_remaining_ms
-                                start_time_ms = now_ms - new_elapsed_ms
-
-                                # 디버깅용 갱신
-                                remaining_time_ms = new_remaining_ms
-                        else: next_items.append(it)
-                    debuff_items = next_items
-
-                if debuff_state.is_slow(now_ms): player.speed = max(1, int(base_speed * debuff_state.slow_multiplier))
-                else: player.speed = base_speed
-                player.update()
-                
-                if player.grid_x == goal_x and player.grid_y == goal_y:
-                    is_hard = getattr(difficulty, 'name', '') in ["Hard", "어려움"]
-
-                if is_hard:
-                    if boss is not None and boss.is_alive:
-                        boss_warning_msg = "clear boss first!"
-                        boss_warning_until_ms = now_ms + 2000
-                    else:
-                        game_over_message = "STAGE CLEAR!"
-                else:
-                    game_over_message = "STAGE CLEAR!"
+                for _ in range(timestep.advance(dt)):
+                    recorder.record(state, pending_inputs)
+                    step(state, pending_inputs, STEP_MS)
+                    pending_inputs = []
+                if state.is_over:
+                    save_session_replay(recorder, state)
+            alpha = timestep.alpha  # 마지막 step 이후 지난 시간 비율 -> 위치 보간
+
+            # 카메라: 보간된 플레이어 위치를 따라감 (움직였으면 화면 전체가 바뀌므로 전체 다시 그리기)
+            prev_origin = view.origin if view is not None else None
+            view = follow_view((win_w, win_h), width, height, cell_size, camera_focus(state, alpha))
+            if view.origin != prev_origin:
+                dirty_tracker.invalidate()
+            if prof: prof.mark("update")
+
+            now_ms = state.now_ms
             # ───────── 3. 화면 그리기 ─────────
-            game_surface.fill((255, 255, 255))
-            draw_maze(game_surface, grid, cell_size, goal_x, goal_y)
-            draw_debuff_items(game_surface, debuff_items, cell_size)
-
-            for (ax, ay) in attack_items:
-                cx = ax * cell_size + cell_size // 2
-                cy = ay * cell_size + cell_size // 2
-                pygame.draw.circle(game_surface, (255, 255, 0), (cx, cy), cell_size // 6)
-
-            if boss and boss.is_alive:
-                boss.draw(game_surface)
-            player.draw(game_surface, cell_size)
-            draw_debuff_hud(game_surface, debuff_state, now_ms, remaining_time_ms, hud_font, attack_charges)
-
-            if boss_warning_msg and now_ms < boss_warning_until_ms:
-                if boss_warning_msg and now_ms < boss_warning_until_ms:
-                    warn_surf = warning_font.render(boss_warning_msg, True, (0, 0, 0))
+            # 메뉴/매뉴얼 오버레이나 창 크기가 다르면(스케일링) 전체 다시 그리기
+            is_overlay = is_menu_mode or show_manual
+            full_redraw = dirty_tracker.full_redraw or is_overlay
+            screen = window_surface
+            if full_redraw:
+                draw_maze_view(screen, grid, view, goal_x, goal_y, state.wall_segments())
+            else:
+                dirty_tracker.restore_view(screen, grid, view, goal_x, goal_y, state.wall_segments())
+            if prof: prof.mark("maze")
+
+            sprite_rects = draw_sprites(screen, state, view, alpha)
+            if prof: prof.mark("sprites")
+            sprite_rects.append(draw_hud(screen, state, hud_font))
+            if prof: prof.mark("hud")
+
+            if state.boss_warning_msg and now_ms < state.boss_warning_until_ms:
+                if state.boss_warning_msg and now_ms < state.boss_warning_until_ms:
+                    warn_surf = render_text(warning_font, state.boss_warning_msg, True, (0, 0, 0))
     
-                    warn_rect = warn_surf.get_rect(center=(game_width // 2, game_height // 2))
+                    warn_rect = warn_surf.get_rect(center=(win_w // 2, win_h // 2))
 
-                    bg_surf = pygame.Surface((warn_rect.width + 40, warn_rect.height + 20))
-                    bg_surf.set_alpha(150)  # 배경 투명도
-                    bg_surf.fill((255, 255, 255))  # 하얀 배경
-                    bg_rect = bg_surf.get_rect(center=(game_width // 2, game_height // 2))
+                    # 하얀 반투명 배경 (alpha 150), 같은 크기면 캐시에서 재사용
+                    bg_surf = get_box((warn_rect.width + 40, warn_rect.height + 20), (255, 255, 255), 150)
+                    bg_rect = bg_surf.get_rect(center=(win_w // 2, win_h // 2))
     
-                    game_surface.blit(bg_surf, bg_rect)
-                    game_surface.blit(warn_surf, warn_rect)
+                    screen.blit(bg_surf, bg_rect)
+                    screen.blit(warn_surf, warn_rect)
+                    sprite_rects.append(bg_rect)
             # 우상단 일시정지 버튼
             if not is_menu_mode and not show_manual:
-                menu.draw_button(game_surface, pause_btn_rect, "MENU", font, mouse_pos)
+                menu.draw_button(screen, pause_btn_rect, "MENU", font, mouse_pos)
+                sprite_rects.append(pause_btn_rect.move(2, 2).union(pause_btn_rect))  # 그림자 포함
+
+            if profiler.enabled:
+                sprite_rects.append(draw_profiler_overlay(screen, profiler.summary(), hud_font))
+
+            dirty_rects = dirty_tracker.finish(sprite_rects, screen.get_rect())
 
             # 오버레이 (메뉴 or 매뉴얼)
-            if is_menu_mode or show_manual:
-                overlay = pygame.Surface((game_width, game_height))
-                overlay.set_alpha(180)
-                overlay.fill((0, 0, 0))
-                game_surface.blit(overlay, (0, 0))
+            if is_overlay:
+                dirty_tracker.invalidate()  # 오버레이가 닫히면 다음 프레임은 전체 다시 그리기
+                overlay = get_box((win_w, win_h), (0, 0, 0), 180)
+                screen.blit(overlay, (0, 0))
 
-                cx, cy = game_width // 2, game_height // 2
+                cx, cy = win_w // 2, win_h // 2
 
                 if show_manual:
                     # [메뉴 파일 사용] 매뉴얼 창 그리기
-                    menu.draw_manual_window(game_surface, pygame.Rect(0,0,game_width,game_height), title_font, font, mouse_pos)
+                    menu.draw_manual_window(screen, screen.get_rect(), title_font, font, mouse_pos)
                 
                 else:
                     # 타이틀
-                    if game_over_message:
-                        t_txt = game_over_message
-                        t_col = (0, 255, 0) if "CLEAR" in game_over_message else (255, 80, 80)
+                    if state.is_over:
+                        t_txt = state.game_over_message
+                        t_col = (0, 255, 0) if state.won else (255, 80, 80)
                     else:
                         t_txt = "PAUSED"
                         t_col = (255, 255, 255)
                     
-                    t_surf = title_font.render(t_txt, True, t_col)
-                    game_surface.blit(t_surf, t_surf.get_rect(center=(cx, cy - 120)))
+                    t_surf = render_text(title_font, t_txt, True, t_col)
+                    screen.blit(t_surf, t_surf.get_rect(center=(cx, cy - 120)))
 
                     # [핵심] menu.py에서 좌표 받아와서 그리기 -> 좌표 일치!
-                    rects = menu.get_menu_rects(cx, cy, is_paused, game_over_message)
+                    rects = menu.get_menu_rects(cx, cy, is_paused, state.game_over_message)
                     
                     if 'resume' in rects:
-                        menu.draw_button(game_surface, rects['resume'], "RESUME", font, mouse_pos)
+                        menu.draw_button(screen, rects['resume'], "RESUME", font, mouse_pos)
                     
                     if 'restart' in rects:
-                        menu.draw_button(game_surface, rects['restart'], "RESTART", font, mouse_pos)
+                        menu.draw_button(screen, rects['restart'], "RESTART", font, mouse_pos)
                     
                     if 'manual' in rects:
-                        menu.draw_button(game_surface, rects['manual'], "MANUAL", font, mouse_pos)
+                        menu.draw_button(screen, rects['manual'], "MANUAL", font, mouse_pos)
                         
                     if 'quit' in rects:
-                        menu.draw_button(game_surface, rects['quit'], "QUIT", font, mouse_pos)
+                        menu.draw_button(screen, rects['quit'], "QUIT", font, mouse_pos)
+
+            if prof: prof.mark("ui")
 
-            scaled_surface = pygame.transform.scale(game_surface, window_surface.get_size())
-            window_surface.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+            if prof:
+                prof.mark("present")
+                prof.end_frame()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
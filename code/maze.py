@@ -1,4 +1,17 @@
+import mmap
+import os
 import random
+import struct
+import threading
+from array import array
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import zip_longest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # numpy가 없으면 PackedGrid.to_numpy(), generate_maze_batch()만 사용 불가
 
 # Directions
 N, S, E, W = 1, 2, 4, 8
@@ -6,40 +19,616 @@ DX = {E: 1, W: -1, N: 0, S: 0}
 DY = {E: 0, W: 0, N: -1, S: 1}
 OPPOSITE = {E: W, W: E, N: S, S: N}
 
-class Tree:
-    def __init__(self):
-        self.parent = None
+# 미로 파일 포맷: 24바이트 헤더 + 셀당 4비트 (한 바이트에 두 칸, 행 단위 바이트 정렬)
+# 헤더: magic, 포맷 버전, 생성기 id, 생성기 버전, flags(bit0: seed 있음), width, height, seed
+MAZE_MAGIC = b"MAZE"
+MAZE_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBBBBIIq")
+_FLAG_HAS_SEED = 1
+
+# 생성기 이름 -> (파일에 기록하는 id, 생성기 버전)
+GENERATOR_IDS = {
+    "kruskal": (1, 1),
+    "eller": (2, 1),
+    "backtracker": (3, 1),
+    "wilson": (4, 1),
+    "sidewinder": (5, 1),
+    "binary_tree": (6, 1),
+}
+
+MazeInfo = namedtuple("MazeInfo", "width height seed generator generator_version version")
+
+class PackedGrid:
+    """셀 하나를 1바이트(cell_bits=8) 또는 4비트(cell_bits=4)로 저장하는 압축 미로 격자
+    grid[y][x] 인덱싱과 len(grid), len(grid[0])은 기존 리스트 격자와 똑같이 동작한다"""
+    def __init__(self, width, height, buffer=None, cell_bits=8):
+        if cell_bits not in (8, 4):
+            raise ValueError("cell_bits는 8 또는 4만 가능합니다")
+        self.width = width
+        self.height = height
+        self.cell_bits = cell_bits
+        # 4비트 모드는 한 바이트에 두 칸 (짝수 x = 하위 니블), 행 단위로 바이트 정렬
+        self.stride = width if cell_bits == 8 else (width + 1) // 2
+        size = self.stride * height
+        if buffer is None:
+            buffer = bytearray(size)
+        self.buffer = memoryview(buffer)[:size]  # 전체 배열 직접 접근용 (복사 없음)
+        if len(self.buffer) < size:
+            raise ValueError("버퍼 크기가 격자 크기보다 작습니다")
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        start = y * self.stride
+        if self.cell_bits == 8:
+            return self.buffer[start:start + self.stride]
+        return _NibbleRow(self.buffer, start, self.width)
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield self[y]
+
+    def get(self, x, y):
+        if self.cell_bits == 8:
+            return self.buffer[y * self.stride + x]
+        b = self.buffer[y * self.stride + (x >> 1)]
+        return b >> 4 if x & 1 else b & 0x0F
+
+    def to_lists(self):
+        """기존 list-of-lists 격자로 변환"""
+        return [list(row) for row in self]
 
-    def root(self):
-        return self.parent.root() if self.parent else self
+    def to_numpy(self):
+        """(height, width) uint8 배열 반환. 8비트 모드는 버퍼를 그대로 공유한다"""
+        if np is None:
+            raise ImportError("to_numpy()에는 numpy가 필요합니다")
+        raw = np.frombuffer(self.buffer, dtype=np.uint8).reshape(self.height, self.stride)
+        if self.cell_bits == 8:
+            return raw
+        out = np.empty((self.height, self.stride * 2), dtype=np.uint8)
+        out[:, 0::2] = raw & 0x0F
+        out[:, 1::2] = raw >> 4
+        return out[:, :self.width]
 
-    def connected(self, other):
-        return self.root() is other.root()
+class _NibbleRow:
+    """4비트 격자의 한 행 (grid[y][x] 호환용)"""
+    def __init__(self, buffer, start, width):
+        self.buffer = buffer
+        self.start = start
+        self.width = width
 
-    def connect(self, other):
-        other.root().parent = self
+    def __len__(self):
+        return self.width
 
-def generate_maze(width, height, seed=None):
+    def __getitem__(self, x):
+        if x < 0:
+            x += self.width
+        if not 0 <= x < self.width:
+            raise IndexError("cell index out of range")
+        b = self.buffer[self.start + (x >> 1)]
+        return b >> 4 if x & 1 else b & 0x0F
+
+    def __iter__(self):
+        for x in range(self.width):
+            yield self[x]
+
+def _iter_edges(width, height):
+    """벽 후보를 (셀 인덱스 << 1 | 방향) 정수로 생성 (방향 0: N, 1: W)
+    예전 (x, y, 방향) 튜플 목록과 같은 순서/길이라서 같은 seed면 같은 미로가 나온다"""
+    for x in range(1, width):
+        yield x << 1 | 1
+    for y in range(1, height):
+        row = y * width
+        yield row << 1
+        for i in range(row + 1, row + width):
+            yield i << 1
+            yield i << 1 | 1
+
+def generate_maze(width, height, seed=None, packed=False):
+    """packed=True면 리스트 대신 PackedGrid(셀당 1바이트)를 반환"""
     rand = random.Random(seed)
-    grid = [[0 for _ in range(width)] for _ in range(height)]
-    sets = [[Tree() for _ in range(width)] for _ in range(height)]
+    cells = bytearray(width * height)  # 셀 하나당 1바이트 (y * width + x)
+
+    edges = array('i', _iter_edges(width, height))
+    rand.shuffle(edges)
+
+    # 정수 배열 기반 Union-Find: 반복 find + 경로 압축(path halving) + 랭크 기준 합치기
+    # 셀마다 객체를 만들지 않고, 재귀도 없어서 수백만 칸 미로도 RecursionError 없이 생성된다
+    parent = array('i', range(width * height))
+    rank = bytearray(width * height)  # 랭크는 log2(셀 수)를 넘지 않으므로 1바이트면 충분
+
+    for edge in reversed(edges):
+        cell = edge >> 1
+        if edge & 1:
+            other, direction, back = cell - 1, W, E
+        else:
+            other, direction, back = cell - width, N, S
+
+        a = cell
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        b = other
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a == b:
+            continue
 
-    edges = []
+        if rank[a] < rank[b]:
+            parent[a] = b
+        else:
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+
+        cells[cell] |= direction
+        cells[other] |= back
+
+    return _to_grid(cells, width, height, packed)
+
+def _to_grid(cells, width, height, packed):
+    """평면 bytearray(y * width + x) -> PackedGrid 또는 list-of-lists"""
+    if packed:
+        return PackedGrid(width, height, cells)
+    return [list(cells[y * width:(y + 1) * width]) for y in range(height)]
+
+def _neighbor_table(width, height):
+    """칸 인덱스 -> ((이웃 인덱스, 방향, 반대 방향), ...) 를 가장자리 모양 16가지로 묶은 표
+    (칸마다 튜플을 만들지 않고 (i + delta, d, back) 만 계산하면 되도록)"""
+    table = {}
+    for mask in range(16):
+        moves = []
+        if not mask & 1: moves.append((-width, N, S))
+        if not mask & 2: moves.append((width, S, N))
+        if not mask & 4: moves.append((1, E, W))
+        if not mask & 8: moves.append((-1, W, E))
+        table[mask] = tuple(moves)
+    def moves_of(i):
+        x, y = i % width, i // width
+        return table[(y == 0) | (y == height - 1) << 1 | (x == width - 1) << 2 | (x == 0) << 3]
+    return moves_of
+
+def generate_maze_backtracker(width, height, seed=None, packed=False):
+    """반복형 깊이 우선 탐색 (recursive backtracker를 명시적 스택으로)
+    길고 구불구불한 복도, 막다른 길/갈림길이 적은 미로. 재귀가 없어서 큰 미로도 안전"""
+    rand = random.Random(seed)
+    size = width * height
+    cells = bytearray(size)
+    visited = bytearray(size)
+    moves_of = _neighbor_table(width, height)
+    stack = array('i', [0])
+    visited[0] = 1
+    while stack:
+        i = stack[-1]
+        options = [(i + delta, d, back) for delta, d, back in moves_of(i) if not visited[i + delta]]
+        if not options:
+            stack.pop()
+            continue
+        j, d, back = options[rand.randrange(len(options))] if len(options) > 1 else options[0]
+        cells[i] |= d
+        cells[j] |= back
+        visited[j] = 1
+        stack.append(j)
+    return _to_grid(cells, width, height, packed)
+
+def generate_maze_wilson(width, height, seed=None, packed=False):
+    """Wilson 알고리즘 (loop-erased random walk): 가능한 모든 미로 중 균일하게 하나를 고른다
+    처음 몇 번의 걷기가 오래 걸려서 다른 생성기보다 느리다"""
+    rand = random.Random(seed)
+    size = width * height
+    cells = bytearray(size)
+    in_maze = bytearray(size)
+    exit_dir = [None] * size   # 걷는 중 각 칸에서 마지막으로 나간 방향 (덮어쓰기 = 고리 지우기)
+    moves_of = _neighbor_table(width, height)
+    in_maze[rand.randrange(size)] = 1
+    for start in range(size):
+        if in_maze[start]:
+            continue
+        i = start
+        while not in_maze[i]:
+            moves = moves_of(i)
+            move = moves[rand.randrange(len(moves))]
+            exit_dir[i] = move
+            i += move[0]
+        i = start
+        while not in_maze[i]:
+            delta, d, back = exit_dir[i]
+            cells[i] |= d
+            cells[i + delta] |= back
+            in_maze[i] = 1
+            i += delta
+    return _to_grid(cells, width, height, packed)
+
+# sidewinder / binary_tree 는 칸마다 rand.random()을 정해진 개수만 꺼내 쓴다
+# (칸 순서 = 행 우선). 같은 seed의 난수열만 있으면 칸들을 한꺼번에 계산할 수 있어서
+# numpy 일괄 생성(generate_maze_batch, compat=True)이 같은 비트의 미로를 만들 수 있다.
+
+def generate_maze_sidewinder(width, height, seed=None, packed=False):
+    """Sidewinder: 행마다 동쪽으로 구간을 잇다가 끊을 때 그 구간의 한 칸에서 북쪽으로 뚫는다
+    맨 윗 행은 한 줄 복도, 북쪽으로 갈수록 쉬운 미로. 칸마다 난수 2개 (끊기, 북쪽 칸 고르기)"""
+    rand = random.Random(seed)
+    cells = bytearray(width * height)
     for y in range(height):
+        row = y * width
+        run_start = 0
         for x in range(width):
-            if y > 0: edges.append((x, y, N))
-            if x > 0: edges.append((x, y, W))
+            close_r = rand.random()
+            pick_r = rand.random()
+            if x == width - 1 or (y > 0 and close_r < 0.5):
+                if y > 0:
+                    cx = row + run_start + int(pick_r * (x - run_start + 1))
+                    cells[cx] |= N
+                    cells[cx - width] |= S
+                run_start = x + 1
+            else:
+                cells[row + x] |= E
+                cells[row + x + 1] |= W
+    return _to_grid(cells, width, height, packed)
 
-    rand.shuffle(edges)
+def generate_maze_binary_tree(width, height, seed=None, packed=False):
+    """Binary tree: 칸마다 북쪽 또는 서쪽 중 하나를 뚫는다 (윗 행/왼쪽 열은 한 방향뿐)
+    가장 빠르지만 북서쪽으로 치우친 대각선 무늬. 칸마다 난수 1개"""
+    rand = random.Random(seed)
+    cells = bytearray(width * height)
+    for y in range(height):
+        row = y * width
+        for x in range(width):
+            r = rand.random()
+            if y > 0 and (x == 0 or r < 0.5):
+                cells[row + x] |= N
+                cells[row + x - width] |= S
+            elif x > 0:
+                cells[row + x] |= W
+                cells[row + x - 1] |= E
+    return _to_grid(cells, width, height, packed)
+
+def iter_maze_rows(width, height, seed=None):
+    """Eller 알고리즘으로 미로를 위에서부터 한 행씩 생성해서 yield 한다
+    각 행은 길이 width의 bytearray (N/S/E/W 비트는 generate_maze와 동일)
+    현재 행의 집합 정보만 들고 있으므로 메모리는 O(width)"""
+    rand = random.Random(seed)
+    labels = [0] * width          # 현재 행 각 칸이 속한 집합 번호
+    down = bytearray(width)       # 윗 행에서 아래(S)로 뚫려 내려온 칸
+    next_label = 0
+
+    for y in range(height):
+        row = bytearray(width)
+        members = {}              # 집합 번호 -> 그 집합에 속한 칸(x) 목록
+        for x in range(width):
+            if down[x]:
+                row[x] |= N
+            else:
+                labels[x] = next_label
+                next_label += 1
+            members.setdefault(labels[x], []).append(x)
+
+        # 1) 가로 연결: 마지막 행은 서로 다른 집합을 전부 이어서 미로를 완성
+        last = y == height - 1
+        for x in range(width - 1):
+            a, b = labels[x], labels[x + 1]
+            if a != b and (last or rand.random() < 0.5):
+                row[x] |= E
+                row[x + 1] |= W
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for i in members[b]:
+                    labels[i] = a
+                members[a].extend(members.pop(b))
+
+        # 2) 세로 연결: 집합마다 최소 한 칸은 아래 행으로 뚫는다
+        if not last:
+            down = bytearray(width)
+            for cols in members.values():
+                picked = [x for x in cols if rand.random() < 0.5]
+                if not picked:
+                    picked = [rand.choice(cols)]
+                for x in picked:
+                    row[x] |= S
+                    down[x] = 1
+
+        yield row
+
+def generate_maze_eller(width, height, seed=None, packed=False):
+    """iter_maze_rows 결과를 모아서 격자 하나로 반환"""
+    if packed:
+        grid = PackedGrid(width, height)
+        for y, row in enumerate(iter_maze_rows(width, height, seed)):
+            grid.buffer[y * width:(y + 1) * width] = row
+        return grid
+    return [list(row) for row in iter_maze_rows(width, height, seed)]
+
+# 생성기 이름 -> 생성 함수 (모두 (width, height, seed, packed) 인자를 받는다)
+GENERATORS = {
+    "kruskal": generate_maze,
+    "eller": generate_maze_eller,
+    "backtracker": generate_maze_backtracker,
+    "wilson": generate_maze_wilson,
+    "sidewinder": generate_maze_sidewinder,
+    "binary_tree": generate_maze_binary_tree,
+}
+
+# ===== numpy 일괄 생성 =====
+# 여러 seed의 미로를 (n, height, width) uint8 배열 하나로 한꺼번에 만든다 (코퍼스/서버 미리 생성용)
+# 칸 인코딩(N/S/E/W 비트)은 다른 생성기와 같고, 난수는 두 가지 중 고른다
+#   compat=False (기본): seed마다 64비트 키를 정해 SplitMix64 카운터 해시로 난수를 한꺼번에 만든다.
+#       같은 seed면 (같이 만든 다른 seed와 상관없이) 항상 같은 미로지만 GENERATORS[이름](w, h, seed)와는 다른 미로
+#   compat=True: random.Random(seed)의 Mersenne Twister를 seed 축으로 벡터화해서 난수열을 그대로 재현
+#       -> [i]가 GENERATORS[이름](width, height, seeds[i])와 같은 비트 (seed 은행처럼 게임과 같은 미로가 필요할 때)
+#       MT 상태 갱신 비용 때문에 순수 파이썬 반복보다 몇 배 빠른 정도
+BATCH_GENERATORS = ("binary_tree", "sidewinder")
+
+def generate_maze_batch(width, height, seeds, algorithm="binary_tree", compat=False):
+    """seed 목록(정수) -> (len(seeds), height, width) uint8 배열
+    미로 규칙은 칸 단위 배열 연산으로 처리하므로 파이썬 반복은 seed 수와 상관없다 (compat는 위 설명 참고)"""
+    if np is None:
+        raise ImportError("generate_maze_batch()에는 numpy가 필요합니다")
+    if algorithm not in BATCH_GENERATORS:
+        raise ValueError(f"일괄 생성을 지원하지 않는 생성기: {algorithm} (가능: {', '.join(BATCH_GENERATORS)})")
+    seeds = [int(seed) for seed in seeds]
+    if compat:
+        return _compat_batch(width, height, seeds, algorithm)
+    n, cells = len(seeds), width * height
+    coin_words = -(-cells // 64)  # 64비트 단어 하나 = 칸 64개의 동전
+    keys = _mix64(np.array([seed % (1 << 64) for seed in seeds], dtype=np.uint64))  # seed의 하위 64비트
+    words = _splitmix_words(keys, 0, coin_words)
+    coin = np.unpackbits(words.astype("<u8").view(np.uint8), axis=1, bitorder="little")[:, :cells]
+    coin = coin.reshape(n, height, width).view(bool)
+    if algorithm == "binary_tree":
+        return _binary_tree_batch(coin)
+
+    # 구간 위치용 16비트 값: 칸마다 하나 (동전 단어 뒤 단어들, 단어 하나 = 칸 4개), [0, length) 로 줄여 씀
+    picks = _splitmix_words(keys, coin_words, -(-cells // 4)).astype("<u8").view("<u2")[:, :cells].reshape(-1)
+
+    def pick(flat, length):
+        return (picks[flat].astype(np.intp) * length) >> 16
+    return _sidewinder_batch(coin, pick)
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15) if np is not None else None
+
+def _mix64(z):
+    """SplitMix64 마무리 섞기 (uint64 배열, 넘침은 2^64로 감김)"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def _splitmix_words(keys, first, count):
+    """키마다 SplitMix64 단어 first ~ first + count - 1 -> (n, count) uint64"""
+    counters = (np.arange(first + 1, first + count + 1, dtype=np.uint64) * _GOLDEN)[None, :]
+    return _mix64(keys[:, None] + counters)
+
+def _compat_batch(width, height, seeds, algorithm):
+    n, cells = len(seeds), width * height
+    # random() 하나 = MT 단어 2개. 칸 순서(행 우선)대로 binary_tree는 칸당 random() 1개, sidewinder는 2개
+    # random() < 0.5 는 첫 단어의 최상위 비트가 0인 것과 같아서 동전 던지기는 실수로 바꾸지 않는다
+    if algorithm == "binary_tree":
+        words = _batch_words(seeds, 2 * cells).reshape(height, width, 2, n)
+        coin = _temper(words[:, :, 0]) < np.uint32(0x80000000)
+        return _binary_tree_batch(np.moveaxis(coin, 2, 0))
+    words = _batch_words(seeds, 4 * cells).reshape(cells, 4, n)
+    close_coin = (_temper(words[:, 0]) < np.uint32(0x80000000)).reshape(height, width, n)
+
+    def pick(flat, length):
+        b, cell = np.divmod(flat, cells)
+        pick_r = _unit(_temper(words[cell, 2, b]), _temper(words[cell, 3, b]))
+        return (pick_r * length).astype(np.intp)  # 순수 버전의 int(pick_r * 길이)
+    return _sidewinder_batch(np.moveaxis(close_coin, 2, 0), pick)
+
+def _bits(mask, direction):
+    """bool 배열 -> 그 칸이면 direction, 아니면 0 인 uint8 배열 (np.where 보다 훨씬 빠름)"""
+    return mask.view(np.uint8) * np.uint8(direction)
+
+def _binary_tree_batch(coin):
+    """coin: (n, height, width) bool, 순수 버전의 r < 0.5"""
+    n, height, width = coin.shape
+    coin = np.ascontiguousarray(coin)  # 결과도 (n, height, width) C 순서
+    not_top = (np.arange(height) > 0)[:, None]
+    not_left = (np.arange(width) > 0)[None, :]
+    north = not_top & (coin | ~not_left)
+    west = ~north & not_left
+    cells = _bits(north, N) | _bits(west, W)
+    cells[:, :-1, :] |= _bits(north[:, 1:, :], S)
+    cells[:, :, :-1] |= _bits(west[:, :, 1:], E)
+    return cells
+
+def _sidewinder_batch(close_coin, pick):
+    """close_coin: (n, height, width) bool (순수 버전의 close_r < 0.5)
+    pick(flat, length): 끊기는 칸마다 구간 안에서 북쪽으로 뚫을 위치 [0, length) (끊기는 칸에서만 계산)
+    flat = 미로 번호 * (height * width) + y * width + x"""
+    n, height, width = close_coin.shape
+    not_top = (np.arange(height) > 0)[:, None]
+    last = (np.arange(width) == width - 1)[None, :]
+    close = np.ascontiguousarray(last | (not_top & close_coin))  # 아래 reshape(-1)가 복사 없이 원본을 가리키도록
+    east = ~close
+    cells = _bits(east, E)
+    cells[:, :, 1:] |= _bits(east[:, :, :-1], W)
+
+    # 각 칸이 속한 구간의 시작 x = 같은 행에서 그 앞의 마지막 끊긴 칸 + 1 (행 첫 칸이면 0)
+    # 평면 인덱스로 다룸 (3차원 팬시 인덱싱보다 빠름)
+    xs = np.arange(1, width + 1, dtype=np.min_scalar_type(width))
+    after = np.maximum.accumulate(close.view(np.uint8) * xs, axis=2).reshape(-1)
+    flat = np.flatnonzero(close & not_top)
+    x = flat % width
+    start = after[flat - 1] * (x > 0)  # x == 0 이면 flat - 1 은 앞 행 칸이라 0으로
+    north = flat - x + start + pick(flat, x - start + 1)
+    # 구간마다 북쪽 칸은 하나뿐: 표시만 해 두고 방향 비트는 배열 연산으로
+    opened = np.zeros(cells.shape, dtype=bool)
+    opened.reshape(-1)[north] = True
+    cells |= _bits(opened, N)
+    cells[:, :-1, :] |= _bits(opened[:, 1:, :], S)
+    return cells
+
+# Mersenne Twister (random.Random과 같은 MT19937, seed 하나 = 열 하나)
+_MT_N, _MT_M = 624, 397
+_MT_INIT = None
+
+def _seed_key(seed):
+    """random.Random(int) 가 init_by_array 에 넘기는 32비트 단어 목록 (abs(seed), 하위 단어부터)"""
+    n = abs(seed)
+    key = []
+    while True:
+        key.append(n & 0xFFFFFFFF)
+        n >>= 32
+        if not n:
+            return key
+
+def _batch_words(seeds, count):
+    """seeds 마다 random.Random(seed)가 내놓을 MT 단어 count 개 (tempering 전) -> (count, len(seeds)) uint32"""
+    out = np.empty((count, len(seeds)), dtype=np.uint32)
+    groups = {}
+    for i, seed in enumerate(seeds):
+        key = _seed_key(seed)
+        groups.setdefault(len(key), []).append((i, key))  # 키 길이가 같은 seed끼리 한 번에 초기화
+    for members in groups.values():
+        index = [i for i, _ in members]
+        out[:, index] = _MTBatch([key for _, key in members]).words(count)
+    return out
+
+def _temper(y):
+    y = y ^ (y >> 11)
+    y ^= (y << 7) & np.uint32(0x9D2C5680)
+    y ^= (y << 15) & np.uint32(0xEFC60000)
+    y ^= y >> 18
+    return y
+
+def _unit(a, b):
+    """tempering 한 단어 두 개 -> random.random()과 같은 53비트 실수"""
+    return ((a >> 5).astype(np.float64) * 67108864.0 + (b >> 6)) * (1.0 / 9007199254740992.0)
+
+class _MTBatch:
+    """MT19937 n개를 (624, n) uint32 배열로 들고 한꺼번에 진행 (init_by_array, twist, tempering)"""
+    def __init__(self, keys):
+        global _MT_INIT
+        if _MT_INIT is None:
+            init = [19650218]
+            for i in range(1, _MT_N):
+                init.append((1812433253 * (init[-1] ^ (init[-1] >> 30)) + i) & 0xFFFFFFFF)
+            _MT_INIT = np.array(init, dtype=np.uint32)
+        n, length = len(keys), len(keys[0])
+        key = np.array(keys, dtype=np.uint32).T   # (length, n)
+        mt = np.repeat(_MT_INIT[:, None], n, axis=1)
+        i, j = 1, 0
+        for _ in range(max(_MT_N, length)):
+            prev = mt[i - 1]
+            mt[i] = (mt[i] ^ ((prev ^ (prev >> 30)) * np.uint32(1664525))) + key[j] + np.uint32(j)
+            i += 1
+            j += 1
+            if i >= _MT_N:
+                mt[0] = mt[_MT_N - 1]
+                i = 1
+            if j >= length:
+                j = 0
+        for _ in range(_MT_N - 1):
+            prev = mt[i - 1]
+            mt[i] = (mt[i] ^ ((prev ^ (prev >> 30)) * np.uint32(1566083941))) - np.uint32(i)
+            i += 1
+            if i >= _MT_N:
+                mt[0] = mt[_MT_N - 1]
+                i = 1
+        mt[0] = 0x80000000
+        self.mt = mt
+        self.pos = _MT_N
+
+    def _twist(self):
+        mt = self.mt
+        # 순차 알고리즘과 같은 값을 쓰도록 (이미 바뀐 값 / 아직 안 바뀐 값) 경계에서 나눠서 계산
+        for lo, hi, far in ((0, 227, 397), (227, 454, 0), (454, 623, 227)):
+            y = (mt[lo:hi] & np.uint32(0x80000000)) | (mt[lo + 1:hi + 1] & np.uint32(0x7FFFFFFF))
+            mt[lo:hi] = mt[far:far + hi - lo] ^ (y >> 1) ^ ((y & 1) * np.uint32(0x9908B0DF))
+        y = (mt[623] & np.uint32(0x80000000)) | (mt[0] & np.uint32(0x7FFFFFFF))
+        mt[623] = mt[396] ^ (y >> 1) ^ ((y & 1) * np.uint32(0x9908B0DF))
+        self.pos = 0
+
+    def words(self, count):
+        """다음 단어 count 개 (tempering 전) -> (count, n)"""
+        out = np.empty((count, self.mt.shape[1]), dtype=np.uint32)
+        filled = 0
+        while filled < count:
+            if self.pos >= _MT_N:
+                self._twist()
+            take = min(_MT_N - self.pos, count - filled)
+            out[filled:filled + take] = self.mt[self.pos:self.pos + take]
+            self.pos += take
+            filled += take
+        return out
+
+# ===== 미로 파일 저장 / 불러오기 =====
+def save_maze(path, grid, seed=None, generator="kruskal"):
+    """격자(리스트 또는 PackedGrid)를 바이너리 미로 파일로 저장"""
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    if isinstance(grid, PackedGrid) and grid.cell_bits == 4:
+        # 이미 파일과 같은 레이아웃이면 버퍼를 그대로 기록
+        header = _pack_header(width, height, seed, generator)
+        with _atomic_write(path) as f:
+            f.write(header)
+            f.write(grid.buffer)
+        return
+    save_maze_rows(path, width, height, iter(grid), seed, generator)
+
+def save_maze_rows(path, width, height, rows, seed=None, generator="eller"):
+    """행 단위로 받은 미로를 바로 파일에 기록 (iter_maze_rows와 함께 쓰면 메모리 O(width))
+    행 길이/개수가 틀려서 ValueError가 나면 path는 그대로 둔다"""
+    header = _pack_header(width, height, seed, generator)
+    with _atomic_write(path) as f:
+        f.write(header)
+        count = 0
+        for row in rows:
+            if len(row) != width:
+                raise ValueError(f"{count}번 행 길이가 width와 다릅니다 ({len(row)} != {width})")
+            f.write(bytes(lo | hi << 4 for lo, hi in zip_longest(row[0::2], row[1::2], fillvalue=0)))
+            count += 1
+        if count != height:
+            raise ValueError(f"행 개수가 height와 다릅니다 ({count} != {height})")
+
+@contextmanager
+def _atomic_write(path):
+    """임시 파일에 다 쓴 뒤 path로 교체 (다른 프로세스가 반쯤 쓴 파일을 읽지 않음, 실패하면 임시 파일 삭제)
+    임시 파일 이름은 쓰는 쪽(프로세스/스레드)마다 달라서 동시에 써도 남의 파일을 옮기지 않는다"""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
-    while edges:
-        x, y, direction = edges.pop()
-        nx, ny = x + DX[direction], y + DY[direction]
-        set1, set2 = sets[y][x], sets[ny][nx]
+def load_maze(path, use_mmap=True):
+    """미로 파일을 불러와서 (PackedGrid, MazeInfo) 반환
+    use_mmap=True면 파일을 mmap 해서 파싱/복사 없이 4비트 PackedGrid로 바로 노출한다"""
+    with open(path, "rb") as f:
+        info = _unpack_header(f.read(_HEADER.size))
+        if use_mmap:
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))[_HEADER.size:]
+        else:
+            data = bytearray(f.read())
+    if len(data) < info.height * ((info.width + 1) // 2):
+        raise ValueError("미로 파일 내용이 잘렸습니다")
+    return PackedGrid(info.width, info.height, data, cell_bits=4), info
 
-        if not set1.connected(set2):
-            set1.connect(set2)
-            grid[y][x] |= direction
-            grid[ny][nx] |= OPPOSITE[direction]
+def _pack_header(width, height, seed, generator):
+    if generator not in GENERATOR_IDS:
+        raise ValueError(f"알 수 없는 생성기: {generator}")
+    gen_id, gen_version = GENERATOR_IDS[generator]
+    flags = _FLAG_HAS_SEED if seed is not None else 0
+    return _HEADER.pack(MAZE_MAGIC, MAZE_FORMAT_VERSION, gen_id, gen_version, flags,
+                        width, height, seed if seed is not None else 0)
 
-    return grid
+def _unpack_header(raw):
+    if len(raw) < _HEADER.size:
+        raise ValueError("미로 파일 헤더가 잘렸습니다")
+    magic, version, gen_id, gen_version, flags, width, height, seed = _HEADER.unpack(raw)
+    if magic != MAZE_MAGIC:
+        raise ValueError("미로 파일이 아닙니다")
+    if version != MAZE_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 미로 파일 버전: {version}")
+    generator = next((name for name, (i, _) in GENERATOR_IDS.items() if i == gen_id), None)
+    return MazeInfo(width, height, seed if flags & _FLAG_HAS_SEED else None,
+                    generator, gen_version, version)
@@ -0,0 +1,237 @@
+"""미로 대량 생성 + 분석 (오프라인 미로 모음 만들기)
+
+seed 범위를 chunk 단위로 나눠 ProcessPoolExecutor 로 생성/분석하고,
+chunk 하나가 끝날 때마다 열(column) 단위 바이너리 파일로 저장한다.
+중간에 끊겨도 같은 명령을 다시 실행하면 이미 저장된 chunk는 건너뛴다.
+
+사용법 (code/ 에서)
+  python maze_batch.py generate out/30x30 --size 30x30 --count 100000 [--jobs N]
+  python maze_batch.py summary out/30x30
+
+분석 항목 (출발점 (0, 0), 도착점 (w-1, h-1) 기준)
+  solution_length   : 출발점 -> 도착점 최단 경로 길이 (이동 칸 수 = 미로 안 거리)
+  dead_ends         : 막다른 칸 수 (출구 1개)
+  junctions         : 갈림길 칸 수 (출구 3개 이상)
+  branching_factor  : 정답 경로 위 칸에서 평균 몇 갈래로 갈 수 있는지 (출구 수 - 1 의 평균)
+  farthest_distance : 출발점에서 가장 먼 칸까지의 거리
+  boss_distance     : HARD 세션 보스 시작 칸까지의 거리 (placement.boss_spawn_cell)"""
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from maze import BATCH_GENERATORS, GENERATORS, PackedGrid, generate_maze_batch
+from pathfinding import compute_distance_field, flat_cells
+from placement import boss_spawn_cell
+
+# (열 이름, array typecode)
+COLUMNS = (
+    ("seed", "q"),
+    ("solution_length", "i"),
+    ("dead_ends", "i"),
+    ("junctions", "i"),
+    ("branching_factor", "f"),
+    ("farthest_distance", "i"),
+    ("boss_distance", "i"),
+)
+
+CHUNK_MAGIC = b"MSTA"
+CHUNK_FORMAT_VERSION = 2
+_CHUNK_HEADER = struct.Struct("<4sBBHIq")  # magic, version, 열 개수, 예약, 행 수, 첫 seed
+MANIFEST = "manifest.json"
+
+# 칸 값(열린 방향 비트) -> 출구 수
+_DEGREE = bytes(bin(c & 15).count("1") for c in range(256))
+
+def analyze_maze(grid, width, height, seed=None):
+    """미로 하나의 통계 dict (COLUMNS 중 seed 제외, seed가 없으면 boss_distance는 -1)"""
+    degrees = bytes(flat_cells(grid, width)).translate(_DEGREE)  # 칸별 출구 수를 C 수준에서 한 번에 계산
+    field = compute_distance_field(grid, 0, 0)
+    gx, gy = width - 1, height - 1
+
+    path = field.path_to(gx, gy)
+    inner = path[:-1] or path  # 도착 칸은 더 갈 곳이 없으므로 제외
+    branching = sum(degrees[y * width + x] - 1 for x, y in inner) / len(inner)
+    return {
+        "solution_length": field.distance(gx, gy),
+        "dead_ends": degrees.count(1),
+        "junctions": degrees.count(3) + degrees.count(4),
+        "branching_factor": branching,
+        "farthest_distance": max(field.dist),
+        "boss_distance": field.distance(*boss_spawn_cell(seed, width, height)) if seed is not None else -1,
+    }
+
+def run_chunk(width, height, algorithm, first_seed, count):
+    """seed [first_seed, first_seed + count) 를 생성/분석해서 chunk 파일 내용(bytes)으로 반환
+    (워커 프로세스에서 실행, 결과만 돌려보내므로 프로세스 간 전송량이 작다)"""
+    columns = {name: array(code) for name, code in COLUMNS}
+    for seed, grid in _generate_range(width, height, algorithm, first_seed, count):
+        stats = analyze_maze(grid, width, height, seed)
+        columns["seed"].append(seed)
+        for name, _ in COLUMNS[1:]:
+            columns[name].append(stats[name])
+    out = bytearray(_CHUNK_HEADER.pack(CHUNK_MAGIC, CHUNK_FORMAT_VERSION, len(COLUMNS), 0, count, first_seed))
+    for name, _ in COLUMNS:
+        out += columns[name].tobytes()
+    return bytes(out)
+
+BATCH_SIZE = 1024  # generate_maze_batch 한 번에 만드는 미로 수 (메모리: 약 BATCH_SIZE x 칸 수 x 16바이트)
+
+def _generate_range(width, height, algorithm, first_seed, count):
+    """(seed, PackedGrid) 순회, numpy가 있고 배치 생성이 되는 알고리즘이면 BATCH_SIZE개씩 한 번에 만든다
+    chunk 지표는 seed 은행을 거쳐 게임이 같은 seed로 다시 만드는 미로의 것이어야 하므로 항상 compat=True
+    (같은 seed의 generate(...)와 칸 단위까지 같음, 빠른 기본 경로는 다른 미로를 만든다)"""
+    end = first_seed + count
+    if algorithm in BATCH_GENERATORS:
+        try:
+            for start in range(first_seed, end, BATCH_SIZE):
+                seeds = range(start, min(start + BATCH_SIZE, end))
+                cells = generate_maze_batch(width, height, seeds, algorithm, compat=True)
+                for seed, maze in zip(seeds, cells):
+                    yield seed, PackedGrid(width, height, bytearray(maze.tobytes()))
+            return
+        except ImportError:  # numpy 없음 -> 아래 한 개씩 생성
+            pass
+    generate = GENERATORS[algorithm]
+    for seed in range(first_seed, end):
+        yield seed, generate(width, height, seed, packed=True)
+
+def read_chunk(data):
+    """chunk 파일 내용 -> {열 이름: array}"""
+    if len(data) < _CHUNK_HEADER.size:
+        raise ValueError("chunk 파일이 너무 짧습니다")
+    magic, version, ncols, _, rows, _ = _CHUNK_HEADER.unpack_from(data)
+    if magic != CHUNK_MAGIC or version != CHUNK_FORMAT_VERSION or ncols != len(COLUMNS):
+        raise ValueError("지원하지 않는 chunk 파일입니다")
+    pos = _CHUNK_HEADER.size
+    columns = {}
+    for name, code in COLUMNS:
+        col = array(code)
+        size = rows * col.itemsize
+        if pos + size > len(data):
+            raise ValueError("chunk 파일이 잘렸습니다")
+        col.frombytes(data[pos:pos + size])
+        columns[name] = col
+        pos += size
+    return columns
+
+def _chunk_path(out_dir, first_seed):
+    return os.path.join(out_dir, f"chunk_{first_seed:012d}.bin")
+
+def _load_manifest(out_dir, params):
+    path = os.path.join(out_dir, MANIFEST)
+    if os.path.exists(path):
+        with open(path) as f:
+            saved = json.load(f)
+        if saved != params:
+            raise ValueError(f"{out_dir} 에 다른 설정으로 만든 결과가 있습니다: {saved}")
+        return
+    with open(path + ".tmp", "w") as f:
+        json.dump(params, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+def generate_batch(out_dir, width, height, count, start_seed=0, algorithm="kruskal",
+                   chunk_size=256, jobs=None, progress=print):
+    """seed [start_seed, start_seed + count) 미로를 생성/분석해서 out_dir 에 chunk 파일로 저장
+    이미 있는 chunk는 건너뛴다 (이어서 하기). 이번에 새로 처리한 미로 수 반환"""
+    if algorithm not in GENERATORS:
+        raise ValueError(f"알 수 없는 생성 알고리즘: {algorithm}")
+    os.makedirs(out_dir, exist_ok=True)
+    _load_manifest(out_dir, {
+        "width": width, "height": height, "algorithm": algorithm,
+        "start_seed": start_seed, "count": count, "chunk_size": chunk_size,
+        "columns": [name for name, _ in COLUMNS],
+    })
+
+    todo = []
+    for first in range(start_seed, start_seed + count, chunk_size):
+        n = min(chunk_size, start_seed + count - first)
+        if not os.path.exists(_chunk_path(out_dir, first)):
+            todo.append((first, n))
+    skipped = count - sum(n for _, n in todo)
+    if skipped and progress:
+        progress(f"resume: {skipped} mazes already done, {len(todo)} chunks left")
+
+    done = 0
+    t0 = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = {pool.submit(run_chunk, width, height, algorithm, first, n): (first, n) for first, n in todo}
+        for fut in as_completed(futures):
+            first, n = futures[fut]
+            path = _chunk_path(out_dir, first)
+            # 끊겨도 반쯤 쓴 파일이 남지 않도록 임시 파일에 쓰고 교체
+            with open(path + ".tmp", "wb") as f:
+                f.write(fut.result())
+            os.replace(path + ".tmp", path)
+            done += n
+            if progress:
+                elapsed = time.perf_counter() - t0
+                rate = done / elapsed if elapsed > 0 else 0.0
+                progress(f"{skipped + done}/{count} mazes  {rate:,.0f} mazes/s  "
+                         f"{rate * width * height / 1e6:,.2f} Mcells/s")
+    finally:
+        # Ctrl+C 등으로 중단되면 아직 시작 안 한 chunk는 버리고 바로 종료 (다음 실행 때 이어서)
+        pool.shutdown(wait=True, cancel_futures=True)
+    return done
+
+def load_results(out_dir, use_numpy=False):
+    """out_dir 의 chunk 파일을 seed 순서로 이어 붙인 {열 이름: array} (use_numpy면 numpy 배열)"""
+    columns = {name: array(code) for name, code in COLUMNS}
+    for name in sorted(os.listdir(out_dir)):
+        if name.startswith("chunk_") and name.endswith(".bin"):
+            with open(os.path.join(out_dir, name), "rb") as f:
+                chunk = read_chunk(f.read())
+            for col, values in chunk.items():
+                columns[col].extend(values)
+    if use_numpy:
+        import numpy as np
+        return {name: np.frombuffer(col, dtype=col.typecode) for name, col in columns.items()}
+    return columns
+
+def _parse_size(text):
+    w, _, h = text.lower().partition("x")
+    return int(w), int(h or w)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="미로 대량 생성/분석")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_gen = sub.add_parser("generate", help="seed 범위의 미로를 생성하고 통계를 저장")
+    p_gen.add_argument("out_dir")
+    p_gen.add_argument("--size", type=_parse_size, default=(30, 30), help="예: 30x30")
+    p_gen.add_argument("--count", type=int, default=10_000)
+    p_gen.add_argument("--start-seed", type=int, default=0)
+    p_gen.add_argument("--algorithm", choices=sorted(GENERATORS), default="kruskal")
+    p_gen.add_argument("--chunk", type=int, default=256, help="워커 한 번에 맡기는 seed 수")
+    p_gen.add_argument("--jobs", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    p_sum = sub.add_parser("summary", help="저장된 통계 요약")
+    p_sum.add_argument("out_dir")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        width, height = args.size
+        t0 = time.perf_counter()
+        try:
+            done = generate_batch(args.out_dir, width, height, args.count, args.start_seed,
+                                  args.algorithm, args.chunk, args.jobs)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        elapsed = time.perf_counter() - t0
+        print(f"done: {done} mazes in {elapsed:.1f}s ({done / elapsed if elapsed else 0:,.0f} mazes/s)")
+        return 0
+
+    columns = load_results(args.out_dir)
+    print(f"{len(columns['seed'])} mazes")
+    print(f"{'column':>18} {'min':>10} {'mean':>10} {'max':>10}")
+    for name, _ in COLUMNS[1:]:
+        col = columns[name]
+        if col:
+            print(f"{name:>18} {min(col):>10.2f} {sum(col) / len(col):>10.2f} {max(col):>10.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import os
+import threading
+from collections import OrderedDict
+from maze import GENERATORS, load_maze, save_maze
+
+class MazeCache:
+    """(width, height, seed, algorithm) 키로 생성된 미로를 재사용하는 캐시
+    - 메모리: 바이트 크기 기준 LRU (PackedGrid 버퍼 크기로 계산)
+    - 디스크(선택): disk_dir 에 미로 파일로 저장하고, 다음 실행 때 mmap 으로 바로 불러온다
+    반환되는 격자는 캐시와 공유되므로 수정하면 안 된다
+    세션 미리 만들기(prefetch) 스레드와 같이 쓰므로 목록 조작은 잠금 안에서 (생성 자체는 잠금 밖)"""
+    def __init__(self, max_bytes=8 * 1024 * 1024, disk_dir=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def get(self, width, height, seed, algorithm="kruskal"):
+        if seed is None:
+            # seed 없이 만든 미로는 다시 만들 수 없으니 캐시하지 않음
+            return GENERATORS[algorithm](width, height, seed, packed=True)
+
+        key = (width, height, seed, algorithm)
+        with self._lock:
+            grid = self._entries.get(key)
+            if grid is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return grid
+            self.misses += 1
+
+        grid = self._load_from_disk(key)
+        if grid is None:
+            grid = GENERATORS[algorithm](width, height, seed, packed=True)
+            self._save_to_disk(key, grid)
+        self._put(key, grid)
+        return grid
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _put(self, key, grid):
+        size = len(grid.buffer)
+        if size > self.max_bytes:
+            return  # 한도보다 큰 미로는 메모리에 두지 않음 (디스크 캐시만 사용)
+        with self._lock:
+            old = self._entries.pop(key, None)  # 두 스레드가 같은 미로를 동시에 만든 경우
+            if old is not None:
+                self.current_bytes -= len(old.buffer)
+            self._entries[key] = grid
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self.current_bytes -= len(old.buffer)
+                self.evictions += 1
+
+    def _disk_path(self, key):
+        width, height, seed, algorithm = key
+        return os.path.join(self.disk_dir, f"{algorithm}_{width}x{height}_{seed}.maze")
+
+    def _load_from_disk(self, key):
+        if not self.disk_dir or not isinstance(key[2], int):
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            grid, _ = load_maze(path)
+        except ValueError:
+            return None  # 깨진 파일은 무시하고 새로 생성
+        self.disk_hits += 1
+        return grid
+
+    def _save_to_disk(self, key, grid):
+        if not self.disk_dir or not isinstance(key[2], int):
+            return
+        path = self._disk_path(key)
+        # save_maze는 임시 파일에 쓰고 교체하므로 다른 프로세스(Flask 등)가 반쯤 쓴 파일을 읽지 않는다
+        save_maze(path, grid, seed=key[2], generator=key[3])
+
+# 게임 전체에서 같이 쓰는 기본 캐시
+default_cache = MazeCache()
+
+def get_maze(width, height, seed, algorithm="kruskal"):
+    return default_cache.get(width, height, seed, algorithm)
@@ -1,4 +1,5 @@
 import pygame
+from render_cache import render_text, get_box
 
 # ───────── [버튼 위치 계산 헬퍼] ─────────
 def get_menu_rects(center_x, center_y, is_paused, game_over_message):
@@ -48,7 +49,7 @@ def draw_button(surface, rect, text, font, mouse_pos, base_color=(220, 220, 220)
     # 테두리
     pygame.draw.rect(surface, (0, 0, 0), rect, 2, border_radius=8)
     
-    txt_surf = font.render(text, True, (0, 0, 0))
+    txt_surf = render_text(font, text, True, (0, 0, 0))
     txt_rect = txt_surf.get_rect(center=rect.center)
     surface.blit(txt_surf, txt_rect)
     
@@ -57,9 +58,7 @@ def draw_button(surface, rect, text, font, mouse_pos, base_color=(220, 220, 220)
 # ───────── [매뉴얼 창 그리기] ─────────
 def draw_manual_window(surface, screen_rect, title_font, font, mouse_pos):
     # 반투명 배경
-    overlay = pygame.Surface(screen_rect.size)
-    overlay.set_alpha(150)
-    overlay.fill((0, 0, 0))
+    overlay = get_box(screen_rect.size, (0, 0, 0), 150)
     surface.blit(overlay, (0,0))
 
     panel_w, panel_h = 600, 450
@@ -72,7 +71,7 @@ def draw_manual_window(surface, screen_rect, title_font, font, mouse_pos):
     cx = panel_rect.centerx
     y = panel_rect.y + 40
     
-    title = title_font.render("- GAME MANUAL -", True, (0, 0, 0))
+    title = render_text(title_font, "- GAME MANUAL -", True, (0, 0, 0))
     surface.blit(title, title.get_rect(center=(cx, y)))
     y += 60
 
@@ -92,8 +91,8 @@ def draw_manual_window(surface, screen_rect, title_font, font, mouse_pos):
         elif "[PURPLE]" in label: color = (128, 0, 128)
         elif "[RED]" in label: color = (200, 0, 0)
         
-        lbl_surf = font.render(label, True, color)
-        desc_surf = font.render(desc, True, (50, 50, 50))
+        lbl_surf = render_text(font, label, True, color)
+        desc_surf = render_text(font, desc, True, (50, 50, 50))
         
         surface.blit(lbl_surf, (panel_rect.x + 50, y))
         surface.blit(desc_surf, (panel_rect.x + 200, y))
@@ -0,0 +1,201 @@
+from array import array
+from maze import N, S, E, W, PackedGrid
+
+UNREACHABLE = -1
+
+class DistanceField:
+    """source 칸에서 모든 칸까지의 미로 거리(BFS) + 부모 포인터
+    거리/부모는 y * width + x 인덱스의 평면 배열이라서 조회는 전부 O(1)"""
+    def __init__(self, width, height, source, dist, parent):
+        self.width = width
+        self.height = height
+        self.source = source    # (x, y)
+        self.dist = dist        # array('i'), 못 가는 칸은 UNREACHABLE
+        self.parent = parent    # array('i'), source 쪽으로 한 칸 다가가는 칸 인덱스 (source/못 가는 칸은 -1)
+
+    def distance(self, x, y):
+        return self.dist[y * self.width + x]
+
+    def reachable(self, x, y):
+        return self.dist[y * self.width + x] != UNREACHABLE
+
+    def next_step(self, x, y):
+        """(x, y)에서 source 쪽으로 한 칸 이동한 칸, source이거나 못 가는 칸이면 None"""
+        p = self.parent[y * self.width + x]
+        if p < 0:
+            return None
+        return p % self.width, p // self.width
+
+    def path_to(self, x, y):
+        """source -> (x, y) 최단 경로 칸 목록, 못 가면 빈 리스트"""
+        if not self.reachable(x, y):
+            return []
+        path = []
+        idx = y * self.width + x
+        while idx >= 0:
+            path.append((idx % self.width, idx // self.width))
+            idx = self.parent[idx]
+        path.reverse()
+        return path
+
+    def farthest(self):
+        """source에서 가장 먼 칸 (x, y, 거리)"""
+        d = max(self.dist)
+        idx = self.dist.index(d)
+        return idx % self.width, idx // self.width, d
+
+def flat_cells(grid, width):
+    """격자(리스트 또는 PackedGrid)의 칸 값을 행 우선 1차원 바이트열로 (칸 (x, y) = [y * width + x])
+    8비트 PackedGrid는 복사 없이 버퍼를 그대로 돌려주므로 읽기만 할 것"""
+    if isinstance(grid, PackedGrid) and grid.cell_bits == 8:
+        return grid.buffer  # 복사 없이 그대로 사용
+    return bytes(c for row in grid for c in row[:width])
+
+def compute_distance_field(grid, sx, sy, stop=None):
+    """(sx, sy)에서 시작하는 BFS 한 번으로 전체 거리장 계산 (칸당 O(1), 2차원 리스트 할당 없음)
+    stop=(x, y)면 그 칸을 큐에서 꺼내는 순간 멈춘다 (그 칸까지의 거리/경로만 확정, 나머지는 계산 중이던 값)"""
+    height = len(grid)
+    width = len(grid[0])
+    size = width * height
+    cells = flat_cells(grid, width)
+
+    dist = array('i', [UNREACHABLE]) * size
+    parent = array('i', [-1]) * size
+    queue = array('i', [0]) * size  # 각 칸은 한 번만 들어가므로 크기 size면 충분
+
+    start = sy * width + sx
+    stop_index = stop[1] * width + stop[0] if stop is not None else -1
+    dist[start] = 0
+    queue[0] = start
+    head, tail = 0, 1
+    while head < tail:
+        i = queue[head]
+        head += 1
+        if i == stop_index:
+            break
+        cell = cells[i]
+        nd = dist[i] + 1
+        x = i % width
+        if cell & N and i >= width and dist[i - width] < 0:
+            dist[i - width] = nd; parent[i - width] = i
+            queue[tail] = i - width; tail += 1
+        if cell & S and i + width < size and dist[i + width] < 0:
+            dist[i + width] = nd; parent[i + width] = i
+            queue[tail] = i + width; tail += 1
+        if cell & E and x + 1 < width and dist[i + 1] < 0:
+            dist[i + 1] = nd; parent[i + 1] = i
+            queue[tail] = i + 1; tail += 1
+        if cell & W and x > 0 and dist[i - 1] < 0:
+            dist[i - 1] = nd; parent[i - 1] = i
+            queue[tail] = i - 1; tail += 1
+
+    return DistanceField(width, height, (sx, sy), dist, parent)
+
+# ───── 보스 추격용 흐름장 (여러 프레임에 나눠 계산) ─────
+class _FlowBuffer:
+    def __init__(self, size):
+        self.stamp = array('i', [0]) * size   # stamp == gen 인 칸만 이번 계산 결과
+        self.dist = array('i', [0]) * size
+        self.parent = array('i', [0]) * size
+        self.gen = 0
+
+class FlowField:
+    """target 칸(플레이어)을 향한 BFS 흐름장, 여러 보스가 하나를 같이 쓴다
+    - set_target(): 목표 칸이 바뀔 때만 새 BFS를 예약 (같은 칸이면 아무 일도 안 함)
+    - update(): 프레임마다 최대 budget 칸까지만 BFS를 진행 -> 미로가 커져도 프레임 비용 일정
+    - next_step(): 마지막으로 완성된 흐름장 기준으로 target 쪽 다음 칸
+    계산 도중 목표가 또 바뀌면 지금 계산을 끝낸 뒤 최신 목표로 다시 시작한다
+    (큰 미로에서 플레이어가 계속 움직여도 흐름장이 하나도 완성되지 않는 일이 없도록)
+    완성본/계산 중 버퍼 두 벌을 번갈아 쓰고 stamp로 구분해서, 재계산 때 배열을 다시 만들지 않는다"""
+    def __init__(self, grid, budget=1024):
+        self.height = len(grid)
+        self.width = len(grid[0])
+        self.budget = budget
+        size = self.width * self.height
+        self.cells = flat_cells(grid, self.width)
+
+        self.target = None     # 완성된 흐름장의 목표 칸
+        self.pending = None    # 계산 중인 목표 칸 (없으면 None)
+        self.queued = None     # 계산 중에 들어온 다음 목표 칸
+        self._front = None
+        self._back = _FlowBuffer(size)
+        self._spare = _FlowBuffer(size)
+        self._queue = array('i', [0]) * size
+        self._head = self._tail = 0
+
+    def set_target(self, x, y):
+        if self.pending is not None:
+            self.queued = None if (x, y) == self.pending else (x, y)
+            return
+        if (x, y) == self.target:
+            return
+        self._start(x, y)
+
+    def _start(self, x, y):
+        back = self._back
+        back.gen += 1
+        start = y * self.width + x
+        back.stamp[start] = back.gen
+        back.dist[start] = 0
+        back.parent[start] = -1
+        self._queue[0] = start
+        self._head, self._tail = 0, 1
+        self.pending = (x, y)
+
+    def update(self, budget=None):
+        """BFS를 최대 budget 칸 진행하고 이번에 처리한 칸 수를 반환"""
+        if self.pending is None:
+            return 0
+        budget = self.budget if budget is None else budget
+        back, queue, cells = self._back, self._queue, self.cells
+        stamp, dist, parent, gen = back.stamp, back.dist, back.parent, back.gen
+        width, size = self.width, len(queue)
+        start_head = head = self._head
+        tail = self._tail
+        limit = head + budget
+        while head < tail and head < limit:
+            i = queue[head]
+            head += 1
+            cell = cells[i]
+            nd = dist[i] + 1
+            x = i % width
+            if cell & N and i >= width and stamp[i - width] != gen:
+                stamp[i - width] = gen; dist[i - width] = nd; parent[i - width] = i
+                queue[tail] = i - width; tail += 1
+            if cell & S and i + width < size and stamp[i + width] != gen:
+                stamp[i + width] = gen; dist[i + width] = nd; parent[i + width] = i
+                queue[tail] = i + width; tail += 1
+            if cell & E and x + 1 < width and stamp[i + 1] != gen:
+                stamp[i + 1] = gen; dist[i + 1] = nd; parent[i + 1] = i
+                queue[tail] = i + 1; tail += 1
+            if cell & W and x > 0 and stamp[i - 1] != gen:
+                stamp[i - 1] = gen; dist[i - 1] = nd; parent[i - 1] = i
+                queue[tail] = i - 1; tail += 1
+        self._head, self._tail = head, tail
+
+        if head == tail:
+            # 계산 완료 -> 완성본과 교체 (이전 완성본 버퍼는 다음 계산에 재사용)
+            self._front, self._back = back, (self._front or self._spare)
+            self.target, self.pending = self.pending, None
+            if self.queued is not None:
+                self._start(*self.queued)
+                self.queued = None
+        return head - start_head
+
+    def next_step(self, x, y):
+        """(x, y)에서 target 쪽으로 한 칸 이동한 칸, 아직 흐름장이 없거나 못 가면 None"""
+        front = self._front
+        if front is None:
+            return None
+        i = y * self.width + x
+        if front.stamp[i] != front.gen or front.parent[i] < 0:
+            return None
+        p = front.parent[i]
+        return p % self.width, p // self.width
+
+    def distance(self, x, y):
+        front = self._front
+        i = y * self.width + x
+        if front is None or front.stamp[i] != front.gen:
+            return UNREACHABLE
+        return front.dist[i]
@@ -0,0 +1,108 @@
+import random
+
+class CellSampler:
+    """한 세션 동안 미로의 빈 칸을 중복 없이 뽑아 주는 배치 도우미 (보스/아이템 배치용)
+
+    - 처음에는 예전 main.py 배치 코드와 똑같이 rng.randint(x), rng.randint(y)로 찍어 본다
+      -> 빈 칸이 많은 보통 상황에서는 기존 seed의 배치가 그대로 재현된다
+    - 연속으로 max_probes 번 빈 칸을 못 찾으면 칸 인덱스에 대한 부분 Fisher-Yates로 전환
+      -> 뽑을 때마다 O(1)(조건이 있으면 거절된 칸 수만큼 추가)이고, 빈 칸이 없으면 None 반환
+    - 셔플 배열은 바뀐 위치만 dict에 저장하므로 준비 비용은 O(제외한 칸 수)"""
+    def __init__(self, rng, width, height, exclude=(), max_probes=8):
+        self.rng = rng
+        self.width = width
+        self.height = height
+        self.max_probes = max_probes
+        self._used = set()      # 뽑혔거나 제외된 칸 인덱스
+        self._shuffled = False
+        for x, y in exclude:
+            self.exclude(x, y)
+
+    def exclude(self, x, y):
+        """(x, y) 칸을 후보에서 뺀다 (출발점, 도착점, 이미 놓인 아이템 등)"""
+        idx = y * self.width + x
+        if idx in self._used:
+            return
+        self._used.add(idx)
+        if self._shuffled:
+            # 살아 있는 구간 [_i, _m) 의 맨 끝으로 보내고 구간을 줄인다
+            self._m -= 1
+            self._swap(self._where.get(idx, idx), self._m)
+
+    def free_count(self):
+        return self.width * self.height - len(self._used)
+
+    def take(self, ok=None):
+        """빈 칸 하나를 (x, y)로 반환, 조건(ok(x, y))을 만족하는 빈 칸이 없으면 None"""
+        if not self._shuffled:
+            rng, w, h = self.rng, self.width, self.height
+            for _ in range(self.max_probes):
+                x = rng.randint(0, w - 1)
+                y = rng.randint(0, h - 1)
+                if y * w + x not in self._used and (ok is None or ok(x, y)):
+                    self._used.add(y * w + x)
+                    return x, y
+            self._start_shuffle()
+        return self._take_shuffled(ok)
+
+    def take_many(self, k, ok=None):
+        """최대 k개 (빈 칸이 모자라면 있는 만큼만)"""
+        cells = []
+        for _ in range(k):
+            cell = self.take(ok)
+            if cell is None:
+                break
+            cells.append(cell)
+        return cells
+
+    # ───── 부분 Fisher-Yates (희소 배열) ─────
+    def _start_shuffle(self):
+        self._shuffled = True
+        self._vals = {}      # 위치 -> 칸 인덱스 (기본값: 위치 그대로)
+        self._where = {}     # 칸 인덱스 -> 위치
+        self._i = 0          # [0, _i): 이미 뽑은 칸
+        self._m = self.width * self.height  # [_m, n): 제외된 칸
+        used = self._used
+        self._used = set()
+        for idx in sorted(used):
+            self.exclude(idx % self.width, idx // self.width)
+
+    def _get(self, pos):
+        return self._vals.get(pos, pos)
+
+    def _swap(self, a, b):
+        if a == b:
+            return
+        va, vb = self._get(a), self._get(b)
+        self._vals[a], self._vals[b] = vb, va
+        self._where[vb], self._where[va] = a, b
+
+    def _take_shuffled(self, ok):
+        limit = self._m
+        while self._i < limit:
+            j = self.rng.randrange(self._i, limit)
+            idx = self._get(j)
+            x, y = idx % self.width, idx // self.width
+            if ok is None or ok(x, y):
+                self._swap(self._i, j)
+                self._i += 1
+                self._used.add(idx)
+                return x, y
+            # 이번 조건에 안 맞는 칸은 구간 뒤쪽으로 미뤄 둔다 (다음 take에서는 다시 후보)
+            limit -= 1
+            self._swap(j, limit)
+        return None
+
+def far_from(points, min_dist):
+    """points 모두와 맨해튼 거리가 min_dist 이상인 칸만 허용하는 조건 함수"""
+    def ok(x, y):
+        return all(abs(x - px) + abs(y - py) >= min_dist for px, py in points)
+    return ok
+
+def session_sampler(rng, width, height):
+    """게임 세션 배치용 샘플러 (출발점 (0, 0)과 도착점 (w-1, h-1)은 제외)"""
+    return CellSampler(rng, width, height, exclude=[(0, 0), (width - 1, height - 1)])
+
+def boss_spawn_cell(seed, width, height):
+    """HARD 세션에서 보스가 놓이는 칸 (GameState가 seed의 rng로 맨 처음 뽑는 칸이라 미로 없이도 계산 가능)"""
+    return session_sampler(random.Random(seed), width, height).take()
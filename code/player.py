@@ -1,5 +1,8 @@
 # player.py
-import pygame
+try:
+    import pygame
+except ImportError:
+    pygame = None  # 그리기 없이 game_state 코어만 쓸 때 (헤드리스 실행)
 from maze import N, S, E, W, DX, DY
 
 class Player:
@@ -44,8 +47,16 @@ class Player:
             if self.pixel_x == self.target_pixel_x and self.pixel_y == self.target_pixel_y:
                 self.moving_direction = None 
 
-    def draw(self, surface, cell_size):
-        draw_x = self.pixel_x + cell_size // 2
-        draw_y = self.pixel_y + cell_size // 2
+    def draw(self, surface, cell_size, view=None, pos=None):
+        """view(renderer.View)가 있으면 창 해상도 좌표로 변환해서 그림, 그린 영역 반환
+        pos를 주면 pixel_x/y 대신 그 위치(보간된 픽셀 좌표)에 그림"""
+        x, y = pos if pos is not None else (self.pixel_x, self.pixel_y)
+        radius = 12
+        if view is not None:
+            x, y = view.to_screen(x, y)
+            cell_size = view.cell_size
+            radius = max(3, round(radius * view.scale))
+        draw_x = x + cell_size // 2
+        draw_y = y + cell_size // 2
         
-        pygame.draw.circle(surface, self.color, (draw_x, draw_y), 12)
+        return pygame.draw.circle(surface, self.color, (draw_x, draw_y), radius)
@@ -0,0 +1,71 @@
+"""다음 세션 미리 만들기 (pygame 임포트 없음)
+
+세션을 하는 동안 작업 스레드 하나가 미리 골라 둔 seed로 다음 세션의 GameState
+(미로, 보스/아이템 배치)와 벽 선분을 만들어 둔다. 재시작 때는 take()로 바꿔 끼우기만 하면 된다.
+
+- seed는 호출한 스레드(게임 루프)에서 고른다 (seed 은행 SQLite 연결은 만든 스레드에서만 쓸 수 있음)
+- 아직 시작도 못 했으면 취소하고 그 자리에서 만든다 (예전과 같은 동기 생성)
+- 만드는 중이면 끝날 때까지 기다린다 (처음부터 다시 만드는 것보다 항상 빠름)
+- 작업 스레드에서 예외가 나면 버리고 동기 생성
+
+세션은 seed로만 정해지므로 미리 만들든 그 자리에서 만들든 결과(리플레이)는 같다.
+보스 흐름장은 step()에서 처음 계산되는 것까지 게임 규칙이라 여기서 미리 돌리지 않는다."""
+from concurrent.futures import ThreadPoolExecutor
+from game_state import GameState
+from seed_bank import pick_session_seed
+
+def build_session(difficulty, seed):
+    """seed로 세션 하나를 만들고 그리기에 쓰는 파생 데이터(벽 선분)까지 계산해 둔다
+    (거리장은 게임에서 읽는 곳이 없어서 미리 만들지 않음, 필요하면 state.distance_field()가 그때 계산)"""
+    state = GameState(difficulty, seed)
+    state.wall_segments()
+    return state
+
+class SessionPrefetcher:
+    """difficulty 세션을 하나 앞서 만들어 두는 도우미
+    사용법 (main.py 세션 루프)
+        state = prefetcher.take()   # 미리 만든 세션 (없으면 바로 생성)
+        prefetcher.prefetch()       # 이번 세션을 하는 동안 다음 세션 준비"""
+    def __init__(self, difficulty, pick_seed=pick_session_seed):
+        self.difficulty = difficulty
+        self.pick_seed = pick_seed
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-prefetch")
+        self._future = None
+
+        self.hits = 0      # 다 만들어진 세션을 바로 가져감
+        self.waits = 0     # 만드는 중이라 끝날 때까지 기다림
+        self.misses = 0    # 미리 만든 게 없어서 동기 생성
+
+    def prefetch(self, seed=None):
+        """다음 세션을 백그라운드에서 만들기 시작 (이미 준비 중이면 그대로 둔다)"""
+        if self._future is None:
+            if seed is None:
+                seed = self.pick_seed(self.difficulty)
+            self._future = self._pool.submit(build_session, self.difficulty, seed)
+
+    def ready(self):
+        return self._future is not None and self._future.done()
+
+    def take(self):
+        """다음 세션의 GameState (준비가 안 됐으면 여기서 만든다)"""
+        future, self._future = self._future, None
+        if future is not None and not future.cancel():
+            waited = not future.done()
+            try:
+                state = future.result()
+            except Exception:  # 작업 스레드에서 실패한 세션은 버리고 새로 만든다
+                state = None
+            if state is not None:
+                if waited:
+                    self.waits += 1
+                else:
+                    self.hits += 1
+                return state
+        self.misses += 1
+        return build_session(self.difficulty, self.pick_seed(self.difficulty))
+
+    def close(self):
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,122 @@
+"""게임 루프 단계별 프레임 프로파일러 (pygame 임포트 없음)
+
+사용법 (main.py 루프)
+    prof = profiler if profiler.enabled else None   # 꺼져 있으면 단계마다 None 확인 한 번뿐
+    if prof: prof.start_frame()
+    ... 이벤트 처리 ...
+    if prof: prof.mark("events")   # 직전 mark(또는 start_frame) 이후 시간을 "events" 에 더함
+    ...
+    if prof: prof.end_frame()
+
+최근 capacity 프레임만 고정 크기 배열(링 버퍼)에 보관하고,
+summary()로 단계별 평균/p95/최대, export_chrome_trace()/export_csv()로 파일 저장"""
+import csv
+import json
+import time
+from array import array
+
+class FrameProfiler:
+    def __init__(self, phases, capacity=300):
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        self.enabled = False
+        self._index = {name: i for i, name in enumerate(self.phases)}
+        self._durations = array('d', [0.0]) * (capacity * len(self.phases))  # 프레임 x 단계 (초)
+        self._starts = array('d', [0.0]) * capacity   # 프레임 시작 시각 (perf_counter)
+        self.frame_count = 0     # 지금까지 기록한 프레임 수 (링 버퍼 위치 = frame_count % capacity)
+        self._row = 0
+        self._last = 0.0
+        self._summary = None
+        self._summary_at = -1
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()  # 꺼져 있던 동안의 오래된 기록은 버림
+        return self.enabled
+
+    def reset(self):
+        self.frame_count = 0
+        self._summary = None
+        self._summary_at = -1
+
+    def start_frame(self):
+        now = time.perf_counter()
+        n = len(self.phases)
+        self._row = self.frame_count % self.capacity
+        base = self._row * n
+        for i in range(base, base + n):
+            self._durations[i] = 0.0
+        self._starts[self._row] = now
+        self._last = now
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self._durations[self._row * len(self.phases) + self._index[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        self.frame_count += 1
+
+    def frames(self):
+        """보관 중인 프레임을 오래된 순서로 (시작 시각, 단계별 시간 목록) 순회 (단위: 초)"""
+        n = len(self.phases)
+        count = min(self.frame_count, self.capacity)
+        first = self.frame_count - count
+        for k in range(first, self.frame_count):
+            row = k % self.capacity
+            yield self._starts[row], self._durations[row * n:(row + 1) * n]
+
+    def summary(self, refresh_every=30):
+        """[(단계 이름, 평균 ms, p95 ms, 최대 ms), ...] + 마지막 줄은 프레임 전체
+        매 프레임 정렬하지 않도록 refresh_every 프레임마다 한 번만 다시 계산"""
+        if self._summary is not None and self.frame_count - self._summary_at < refresh_every:
+            return self._summary
+        per_phase = [[] for _ in self.phases]
+        totals = []
+        for _, durations in self.frames():
+            for i, d in enumerate(durations):
+                per_phase[i].append(d)
+            totals.append(sum(durations))
+        rows = [_stats(name, values) for name, values in zip(self.phases, per_phase)]
+        rows.append(_stats("frame", totals))
+        self._summary = rows
+        self._summary_at = self.frame_count
+        return rows
+
+    def export_chrome_trace(self, path):
+        """chrome://tracing / Perfetto 에서 열 수 있는 JSON (단계마다 "X" 이벤트 하나)"""
+        events = []
+        t0 = None
+        for frame_no, (start, durations) in enumerate(self.frames()):
+            if t0 is None:
+                t0 = start
+            ts = (start - t0) * 1e6
+            events.append({"name": "frame", "ph": "X", "ts": ts, "dur": sum(durations) * 1e6,
+                           "pid": 1, "tid": 1, "args": {"frame": frame_no}})
+            for name, d in zip(self.phases, durations):
+                if d > 0:
+                    events.append({"name": name, "ph": "X", "ts": ts, "dur": d * 1e6, "pid": 1, "tid": 1})
+                    ts += d * 1e6
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export_csv(self, path):
+        """프레임마다 한 줄: frame, start_ms, 단계별 ms..., total_ms"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms"] + [f"{p}_ms" for p in self.phases] + ["total_ms"])
+            t0 = None
+            for frame_no, (start, durations) in enumerate(self.frames()):
+                if t0 is None:
+                    t0 = start
+                writer.writerow([frame_no, f"{(start - t0) * 1000:.3f}"]
+                                + [f"{d * 1000:.3f}" for d in durations]
+                                + [f"{sum(durations) * 1000:.3f}"])
+
+def _stats(name, values):
+    if not values:
+        return name, 0.0, 0.0, 0.0
+    values = sorted(values)
+    n = len(values)
+    return (name, sum(values) / n * 1000, values[min(n - 1, int(n * 0.95))] * 1000, values[-1] * 1000)
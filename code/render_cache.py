@@ -0,0 +1,74 @@
+import pygame
+from collections import OrderedDict
+
+class RenderCache:
+    """매 프레임 똑같이 만드는 글자/반투명 배경 Surface를 재사용하는 LRU 캐시
+    - text(): (font, text, antialias, color) 키로 font.render 결과 보관
+    - box(): (크기, 색, alpha) 키로 단색 배경 Surface 보관
+    - 항목 수(max_entries)와 픽셀 바이트 합(max_bytes) 둘 다로 제한
+      (창 크기만 한 오버레이는 1080p에서 8MB라서, 창 크기를 끌어 바꾸면 크기마다 하나씩 쌓이는 걸 막음)
+    반환되는 Surface는 캐시와 공유되므로 blit 용도로만 쓰고 수정하면 안 된다"""
+    def __init__(self, max_entries=512, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def text(self, font, text, antialias, color):
+        """font.render(text, antialias, color)와 같은 결과 (바뀐 글자만 새로 렌더링)"""
+        key = ("text", font, text, antialias, tuple(color))
+        surf = self._get(key)
+        if surf is None:
+            surf = self._put(key, font.render(text, antialias, color))
+        return surf
+
+    def box(self, size, color, alpha=None):
+        """단색 배경 Surface
+        color가 RGBA면 픽셀 알파(SRCALPHA), alpha를 주면 Surface 전체 알파(set_alpha)"""
+        key = ("box", tuple(size), tuple(color), alpha)
+        surf = self._get(key)
+        if surf is None:
+            if len(color) == 4:
+                surf = pygame.Surface(size, pygame.SRCALPHA)
+            else:
+                surf = pygame.Surface(size)
+            if alpha is not None:
+                surf.set_alpha(alpha)
+            surf.fill(color)
+            surf = self._put(key, surf)
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _get(self, key):
+        surf = self._entries.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return surf
+
+    def _put(self, key, surf):
+        size = surf.get_pitch() * surf.get_height()
+        if size > self.max_bytes:
+            return surf  # 혼자서 한도를 넘는 Surface는 캐시하지 않음
+        self._entries[key] = surf
+        self.current_bytes += size
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.current_bytes -= old.get_pitch() * old.get_height()
+        return surf
+
+# HUD/메뉴/난이도 화면에서 같이 쓰는 기본 캐시
+default_cache = RenderCache()
+
+def render_text(font, text, antialias, color):
+    return default_cache.text(font, text, antialias, color)
+
+def get_box(size, color, alpha=None):
+    return default_cache.box(size, color, alpha)
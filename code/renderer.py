@@ -1,46 +1,236 @@
 import pygame
-from maze import N, S, E, W
+from collections import OrderedDict
+from wall_geometry import build_wall_segments
+from render_cache import render_text, get_box
 
-def draw_maze(surface, grid, cell_size, goal_x, goal_y):
+# ───── 화면 배치 (창 해상도 그대로 그리기) ─────
+CAMERA_MIN_CELL = 16   # 미로 전체를 창에 넣으면 셀이 이보다 작아질 때 카메라 모드로 전환
+CAMERA_MAX_CELL = 32   # 카메라 모드 셀 크기 상한 (벽 조각 Surface 크기도 이걸로 제한됨)
+
+class View:
+    """논리 좌표(난이도 셀 크기 기준 픽셀) -> 창 좌표 변환
+    cell_size : 창에 그릴 셀 한 칸 크기 (px)
+    origin    : 미로 왼쪽 위가 놓이는 창 좌표 (카메라 모드면 음수일 수 있음)
+    size      : 창 크기 (None이면 미로 전체가 보인다고 봄)
+    scrolling : 카메라 모드 (미로가 창보다 커서 플레이어를 따라 움직임)"""
+    def __init__(self, cell_size, logical_cell, origin=(0, 0), size=None, scrolling=False):
+        self.cell_size = cell_size
+        self.scale = cell_size / logical_cell
+        self.origin = origin
+        self.size = size
+        self.scrolling = scrolling
+
+    def to_screen(self, px, py):
+        return (self.origin[0] + round(px * self.scale),
+                self.origin[1] + round(py * self.scale))
+
+    def visible_cells(self, maze_w, maze_h):
+        """창에 (일부라도) 보이는 칸 범위 (x0, y0, x1, y1), 반열린 구간 [x0, x1) x [y0, y1)"""
+        if self.size is None:
+            return 0, 0, maze_w, maze_h
+        c = self.cell_size
+        ox, oy = self.origin
+        return (max(0, -ox // c), max(0, -oy // c),
+                min(maze_w, -(-(self.size[0] - ox) // c)), min(maze_h, -(-(self.size[1] - oy) // c)))
+
+def fit_view(window_size, maze_w, maze_h, logical_cell):
+    """창 크기에 맞는 셀 크기를 정하고 미로를 가운데 정렬한 View 반환"""
+    win_w, win_h = window_size
+    cell = max(4, min(win_w // maze_w, win_h // maze_h))
+    origin = ((win_w - cell * maze_w) // 2, (win_h - cell * maze_h) // 2)
+    return View(cell, logical_cell, origin, tuple(window_size))
+
+def follow_view(window_size, maze_w, maze_h, logical_cell, focus, min_cell=CAMERA_MIN_CELL):
+    """미로 전체가 min_cell 이상 셀 크기로 창에 들어가면 fit_view 와 같고 (카메라 고정),
+    아니면 셀 크기를 고정하고 focus(논리 좌표 픽셀, 보통 플레이어 중심)를 창 가운데에 두는 카메라 View
+    (미로 가장자리 바깥이 보이지 않도록 끝에서는 멈춘다)"""
+    win_w, win_h = window_size
+    if min(win_w // maze_w, win_h // maze_h) >= min_cell:
+        return fit_view(window_size, maze_w, maze_h, logical_cell)
+    cell = max(min_cell, min(logical_cell, CAMERA_MAX_CELL))
+    scale = cell / logical_cell
+    origin = (_camera_axis(win_w, maze_w * cell, focus[0] * scale),
+              _camera_axis(win_h, maze_h * cell, focus[1] * scale))
+    return View(cell, logical_cell, origin, (win_w, win_h), scrolling=True)
+
+def _camera_axis(win, world, focus):
+    if world <= win:
+        return (win - world) // 2  # 이 방향으로는 다 들어가면 가운데 정렬
+    return min(0, max(win - world, round(win / 2 - focus)))
+
+# ───── 지금 미로의 벽 선분 ─────
+# 미로 레이어와 벽 조각이 같이 쓴다. 미로(grid 객체)가 바뀔 때만 바꾸고 지금 미로 하나만 들고 있음
+# walls: 호출하는 쪽이 이미 만든 선분 (GameState.wall_segments(), prefetch가 미리 계산), 없으면 여기서 계산
+_maze_walls = {"grid": None, "walls": None}
+
+def _walls_for(grid, walls=None):
+    if _maze_walls["grid"] is not grid:
+        _maze_walls["walls"] = walls if walls is not None else build_wall_segments(grid)
+        _maze_walls["grid"] = grid
+    return _maze_walls["walls"]
+
+# ───── 미로 정적 레이어 캐시 ─────
+# 벽과 도착점은 미로(grid 객체)나 셀 크기가 바뀔 때만 다시 그리고, 매 프레임은 blit 한 번만 한다
+_maze_layer = {"grid": None, "key": None, "surface": None}
+
+def get_maze_layer(grid, cell_size, goal_x, goal_y, walls=None):
+    key = (cell_size, goal_x, goal_y)
+    if _maze_layer["grid"] is not grid or _maze_layer["key"] != key:
+        _maze_layer["surface"] = build_maze_layer(grid, cell_size, goal_x, goal_y, _walls_for(grid, walls))
+        _maze_layer["grid"] = grid
+        _maze_layer["key"] = key
+    return _maze_layer["surface"]
+
+def build_maze_layer(grid, cell_size, goal_x, goal_y, walls=None):
+    """미로 전체(흰 바탕 + 벽 + 도착점)를 그린 새 Surface (캐시 없이 매번 새로 그림, 보통은 get_maze_layer 사용)
+    walls: grid의 벽 선분 (없으면 새로 계산)"""
     h = len(grid)
     w = len(grid[0])
-    surface.fill((255,255,255))
-
-    for y in range(h):
-        for x in range(w):
-            cx, cy = x*cell_size, y*cell_size
-            cell = grid[y][x]
-            if not (cell & N):
-                pygame.draw.line(surface,(0,0,0),(cx,cy),(cx+cell_size,cy),2)
-            if not (cell & W):
-                pygame.draw.line(surface,(0,0,0),(cx,cy),(cx,cy+cell_size),2)
-            if not (cell & S):
-                pygame.draw.line(surface,(0,0,0),(cx,cy+cell_size),(cx+cell_size,cy+cell_size),2)
-            if not (cell & E):
-                pygame.draw.line(surface,(0,0,0),(cx+cell_size,cy),(cx+cell_size,cy+cell_size),2)
-    
-    gx = goal_x * cell_size + cell_size // 2
-    gy = goal_y * cell_size + cell_size // 2
+    layer = pygame.Surface((w * cell_size, h * cell_size))
+    layer.fill((255,255,255))
+    if walls is None:
+        walls = build_wall_segments(grid)
+    _draw_walls(layer, walls.segments(), cell_size)
+    _draw_goal(layer, cell_size, goal_x, goal_y)
+    return layer
+
+def _draw_walls(layer, segments, cell_size, offset=(0, 0)):
+    """wall_geometry 선분(격자선 좌표)을 그림 (offset: 칸 (0, 0)이 놓이는 layer 좌표)
+    벽 하나가 한 번만, 이어진 벽은 선 하나로 그려져서 칸마다 4방향을 그리던 것보다 draw 호출이 훨씬 적다"""
+    ox, oy = offset
+    c = cell_size
+    line = pygame.draw.line
+    for (x0, y0), (x1, y1) in segments:
+        line(layer, (0,0,0), (ox + x0*c, oy + y0*c), (ox + x1*c, oy + y1*c), 2)
+
+def _draw_goal(layer, cell_size, goal_x, goal_y, offset=(0, 0)):
+    gx = offset[0] + goal_x * cell_size + cell_size // 2
+    gy = offset[1] + goal_y * cell_size + cell_size // 2
     
     radius = max(6, cell_size // 3)
-    pygame.draw.circle(surface, (255, 0, 0), (gx, gy), radius)
-    
-def draw_debuff_items(surface, items, cell_size):
-    import pygame
+    pygame.draw.circle(layer, (255, 0, 0), (gx, gy), radius)
+
+# ───── 큰 미로용 벽 조각(타일) 캐시 ─────
+class MazeTiles:
+    """카메라 모드에서 쓰는 벽 조각 캐시
+    미로를 chunk x chunk 칸 조각으로 나눠 화면에 보이는 조각만 그때그때 그리고,
+    그린 조각은 바이트 크기 기준 LRU로 보관 -> 미로 전체 크기와 상관없이 메모리/프레임 비용 일정
+    (미로 전체 레이어 한 장은 500x500 미로면 수백 MB라서 만들 수 없음)"""
+    def __init__(self, chunk=16, max_bytes=48 * 1024 * 1024):
+        self.chunk = chunk
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._tiles = OrderedDict()   # (tx, ty) -> Surface
+        self._grid = None
+        self._key = None
+        self._walls = None
+        self.builds = 0
+        self.evictions = 0
+
+    def clear(self):
+        self._tiles.clear()
+        self.current_bytes = 0
+
+    def draw(self, surface, grid, view, goal_x, goal_y, clip=None, walls=None):
+        """view 기준으로 창(clip을 주면 그 영역)에 보이는 조각만 blit (walls: get_maze_layer와 같음)"""
+        key = (view.cell_size, goal_x, goal_y)
+        if self._grid is not grid or self._key != key:
+            self.clear()
+            self._grid, self._key = grid, key
+            self._walls = _walls_for(grid, walls)
+        h, w = len(grid), len(grid[0])
+        span = self.chunk * view.cell_size
+        ox, oy = view.origin
+        area = pygame.Rect(clip) if clip is not None else surface.get_rect()
+        tx0, ty0 = max(0, (area.left - ox) // span), max(0, (area.top - oy) // span)
+        tx1 = min(-(-w // self.chunk), -(-(area.right - ox) // span))
+        ty1 = min(-(-h // self.chunk), -(-(area.bottom - oy) // span))
+        if clip is not None:
+            surface.set_clip(area)
+        for ty in range(ty0, ty1):
+            for tx in range(tx0, tx1):
+                surface.blit(self._tile(grid, w, h, view.cell_size, tx, ty), (ox + tx * span, oy + ty * span))
+        if clip is not None:
+            surface.set_clip(None)
+
+    def _tile(self, grid, w, h, cell_size, tx, ty):
+        tile = self._tiles.get((tx, ty))
+        if tile is not None:
+            self._tiles.move_to_end((tx, ty))
+            return tile
+        tile = self._build_tile(grid, w, h, cell_size, tx, ty)
+        self.builds += 1
+        self._tiles[(tx, ty)] = tile
+        self.current_bytes += tile.get_bytesize() * tile.get_width() * tile.get_height()
+        while self.current_bytes > self.max_bytes and len(self._tiles) > 1:
+            _, old = self._tiles.popitem(last=False)
+            self.current_bytes -= old.get_bytesize() * old.get_width() * old.get_height()
+            self.evictions += 1
+        return tile
+
+    def _build_tile(self, grid, w, h, cell_size, tx, ty):
+        x0, y0 = tx * self.chunk, ty * self.chunk
+        x1, y1 = min(w, x0 + self.chunk), min(h, y0 + self.chunk)
+        tile = pygame.Surface(((x1 - x0) * cell_size, (y1 - y0) * cell_size))
+        tile.fill((255,255,255))
+        offset = (-x0 * cell_size, -y0 * cell_size)
+        # 조각 경계선 위의 벽(두께 2)과 조각 밖에서 이어져 들어오는 선분도 그리고 Surface 범위로 잘라냄
+        # (전체 레이어와 같은 픽셀)
+        _draw_walls(tile, self._walls.in_rect(x0, y0, x1, y1), cell_size, offset)
+        _, goal_x, goal_y = self._key
+        _draw_goal(tile, cell_size, goal_x, goal_y, offset)
+        return tile
+
+_maze_tiles = MazeTiles()
+
+def draw_maze(surface, grid, cell_size, goal_x, goal_y, origin=(0, 0), walls=None):
+    layer = get_maze_layer(grid, cell_size, goal_x, goal_y, walls)
+    if surface.get_size() != layer.get_size() or origin != (0, 0):
+        surface.fill((255,255,255))
+    surface.blit(layer, origin)
+
+def draw_maze_view(surface, grid, view, goal_x, goal_y, walls=None):
+    """view에 맞게 미로 그리기: 카메라 모드면 보이는 벽 조각만, 아니면 미로 레이어 한 장
+    walls: grid의 벽 선분 (GameState.wall_segments(), 없으면 미로가 바뀔 때 여기서 계산)"""
+    if not view.scrolling:
+        draw_maze(surface, grid, view.cell_size, goal_x, goal_y, view.origin, walls)
+        return
+    maze_rect = pygame.Rect(view.origin, (len(grid[0]) * view.cell_size, len(grid) * view.cell_size))
+    if not maze_rect.contains(surface.get_rect()):
+        surface.fill((255,255,255))  # 한쪽 방향으로는 미로가 창보다 작아서 여백이 보임
+    _maze_tiles.draw(surface, grid, view, goal_x, goal_y, walls=walls)
+
+def draw_debuff_items(surface, items, cell_size, origin=(0, 0)):
+    """그린 아이템 영역(Rect) 목록 반환"""
+    ox, oy = origin
+    rects = []
     for it in items:
-        cx = it.gx * cell_size + cell_size // 2
-        cy = it.gy * cell_size + cell_size // 2
+        cx = ox + it.gx * cell_size + cell_size // 2
+        cy = oy + it.gy * cell_size + cell_size // 2
         r = max(6, cell_size // 3)  
-        pygame.draw.circle(surface, (0, 0, 0), (cx, cy), r)           
+        rects.append(pygame.draw.circle(surface, (0, 0, 0), (cx, cy), r))
         pygame.draw.circle(surface, (180, 180, 180), (cx, cy), r, 2)
+    return rects
+
+def draw_attack_items(surface, items, cell_size, origin=(0, 0)):
+    """공격 아이템(노란 원) 그리기, 그린 영역(Rect) 목록 반환"""
+    ox, oy = origin
+    rects = []
+    for (ax, ay) in items:
+        cx = ox + ax * cell_size + cell_size // 2
+        cy = oy + ay * cell_size + cell_size // 2
+        rects.append(pygame.draw.circle(surface, (255, 255, 0), (cx, cy), cell_size // 6))
+    return rects
+
 def draw_debuff_hud(surface, debuff_state, now_ms, remaining_time_ms, font, attack_charges):
     """
     surface            : game_surface
     debuff_state       : DebuffState 인스턴스
-    now_ms             : pygame.time.get_ticks()
+    now_ms             : 게임 시간 (GameState.now_ms)
     remaining_time_ms  : 전체 게임 남은 시간 (ms)
     font               : pygame.font.SysFont(None, 24)
     attack_charges     : 남은 공격 아이템 개수 (int)
+    반환값: HUD 박스 영역 (Rect)
     """
     lines = []
 
@@ -69,9 +259,8 @@ def draw_debuff_hud(surface, debuff_state, now_ms, remaining_time_ms, font, atta
     x = surface.get_width() - box_w - 10
     y = 10
 
-    # 반투명 검정 배경
-    bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-    bg.fill((0, 0, 0, 160))
+    # 반투명 검정 배경 (줄 수가 같으면 캐시된 Surface 재사용)
+    bg = get_box((box_w, box_h), (0, 0, 0, 160))
     surface.blit(bg, (x, y))
 
     # 텍스트 그리기
@@ -85,9 +274,80 @@ def draw_debuff_hud(surface, debuff_state, now_ms, remaining_time_ms, font, atta
             label_color = (255, 180, 180)   # 디버프 이름
         value_color = (200, 220, 255)
 
-        label_surf = font.render(label + ":", True, label_color)
-        value_surf = font.render(value, True, value_color)
+        # 같은 글자는 캐시에서 재사용 -> 초 단위 숫자가 바뀔 때만 새로 렌더링
+        label_surf = render_text(font, label + ":", True, label_color)
+        value_surf = render_text(font, value, True, value_color)
 
         surface.blit(label_surf, (x + padding, cur_y))
         surface.blit(value_surf, (x + padding + 100, cur_y))
-        cur_y += line_h
\ No newline at end of file
+        cur_y += line_h
+
+    return pygame.Rect(x, y, box_w, box_h)
+
+def draw_profiler_overlay(surface, rows, font):
+    """프레임 프로파일러 요약(FrameProfiler.summary())을 왼쪽 아래에 표로 그림, 그린 영역 반환"""
+    padding = 6
+    line_h = font.get_height() + 2
+    col_w = 62
+    box_w = 90 + col_w * 3 + padding * 2
+    box_h = padding * 2 + line_h * (len(rows) + 1)
+    x = 10
+    y = surface.get_height() - box_h - 10
+
+    surface.blit(get_box((box_w, box_h), (0, 0, 0, 180)), (x, y))
+    cur_y = y + padding
+    header = ("phase", "avg", "p95", "max")
+    for row_no, row in enumerate([header] + list(rows)):
+        color = (255, 255, 0) if row_no == 0 or row[0] == "frame" else (220, 220, 220)
+        cells = row if row_no == 0 else (row[0],) + tuple(f"{v:.2f}" for v in row[1:])
+        surface.blit(render_text(font, cells[0], True, color), (x + padding, cur_y))
+        for i, text in enumerate(cells[1:]):
+            surf = render_text(font, text, True, color)
+            surface.blit(surf, (x + padding + 90 + col_w * (i + 1) - surf.get_width(), cur_y))  # 숫자는 오른쪽 정렬
+        cur_y += line_h
+    return pygame.Rect(x, y, box_w, box_h)
+
+# ───── 더티 렉트(dirty rect) 관리 ─────
+class DirtyRectTracker:
+    """매 프레임 화면 전체 대신, 스프라이트가 지나간 영역만 정적 레이어로 지우고 갱신한다
+    - restore(): 지난 프레임에 그린 영역을 배경(미로 레이어)으로 되돌림
+    - finish(): 이번 프레임 영역 + 지난 프레임 영역을 합쳐 display.update 대상 반환
+    - invalidate(): 창 크기 변경/메뉴 오버레이 등으로 다음 프레임을 전체 다시 그리게 함"""
+    def __init__(self, margin=2):
+        self.margin = margin          # 선 두께/반올림 오차를 덮기 위한 여유 픽셀
+        self.prev_rects = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def restore(self, surface, background, origin=(0, 0)):
+        """background(미로 레이어)가 origin에 놓여 있다고 보고 지난 프레임 영역을 되돌림"""
+        bg_rect = background.get_rect(topleft=origin)
+        for r in self.prev_rects:
+            if not bg_rect.contains(r):
+                surface.fill((255, 255, 255), r)  # 미로 바깥 여백
+            surface.blit(background, r.topleft, r.move(-origin[0], -origin[1]))
+
+    def restore_view(self, surface, grid, view, goal_x, goal_y, walls=None):
+        """restore()와 같지만 view에 맞는 배경 사용 (카메라 모드면 벽 조각 캐시에서, walls는 draw_maze_view와 같음)"""
+        if not view.scrolling:
+            self.restore(surface, get_maze_layer(grid, view.cell_size, goal_x, goal_y, walls), view.origin)
+            return
+        for r in self.prev_rects:
+            surface.fill((255, 255, 255), r)
+            _maze_tiles.draw(surface, grid, view, goal_x, goal_y, clip=r, walls=walls)
+
+    def finish(self, rects, bounds):
+        """rects: 이번 프레임에 그린 영역 (None은 무시), bounds: 화면 전체 Rect"""
+        cur = []
+        for r in rects:
+            if r is None:
+                continue
+            r = pygame.Rect(r).inflate(self.margin * 2, self.margin * 2).clip(bounds)
+            if r.width and r.height:
+                cur.append(r)
+        dirty = self.prev_rects + cur
+        self.prev_rects = cur
+        self.full_redraw = False
+        return dirty
@@ -0,0 +1,244 @@
+"""리플레이 기록/재생/검증
+
+한 세션은 seed + 난이도 + 입력(몇 번째 step에 무엇을 눌렀는지)만 있으면 그대로 다시 만들 수 있다
+(게임 규칙은 game_state의 고정 간격 step으로만 진행되므로).
+
+파일 형식 (리틀엔디안)
+  헤더 36바이트: magic "MRPL", version, flags, generator id, 결과 코드,
+                width, height, cell (u16), time_limit 초 (u32), seed (i64),
+                끝난 step 수 (u32), 입력 개수 (u32)
+  입력: (이전 입력과의 step 차이 << 3 | 입력 코드) 를 varint로 (보통 입력당 1~2바이트)
+
+사용법 (code/ 에서)
+  python replay.py verify replays/*.mrp [--jobs N]
+  python replay.py play replays/xxx.mrp [--speed 1|4|16]"""
+import argparse
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from difficulty import Difficulty
+from maze import GENERATOR_IDS
+from game_state import (
+    GameState, FixedTimestep, step, skip_idle, STEP_MS, MAX_STEPS_PER_FRAME,
+    UP, DOWN, LEFT, RIGHT, ATTACK_KEY, STAGE_CLEAR, TIME_OVER, CAUGHT
+)
+
+REPLAY_MAGIC = b"MRPL"
+REPLAY_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBBBBHHHIqII")
+_FLAG_HARD = 1
+
+INPUT_CODES = {UP: 0, DOWN: 1, LEFT: 2, RIGHT: 3, ATTACK_KEY: 4}
+_CODE_INPUTS = {code: action for action, code in INPUT_CODES.items()}
+OUTCOME_CODES = {"": 0, STAGE_CLEAR: 1, TIME_OVER: 2, CAUGHT: 3}
+_CODE_OUTCOMES = {code: msg for msg, code in OUTCOME_CODES.items()}
+
+PLAY_SPEEDS = (1, 4, 16)
+
+class Replay:
+    """seed/난이도/입력 기록 + 기록 당시 결과
+    events: (step 번호, 입력) 목록 -> step 번호번째 step()에 그 입력을 넘긴다 (0부터)
+    generator: 미로 생성 알고리즘 (없으면 difficulty.generator)"""
+    def __init__(self, difficulty, seed, events=None, end_step=0, outcome="", generator=None):
+        self.difficulty = difficulty
+        self.seed = seed
+        self.events = events if events is not None else []
+        self.end_step = end_step
+        self.outcome = outcome
+        self.generator = generator or difficulty.generator
+
+    def new_game(self):
+        return GameState(self.difficulty, self.seed)
+
+class ReplayRecorder:
+    """게임 루프에서 step()에 넘긴 입력을 그대로 기록"""
+    def __init__(self, state):
+        self.replay = Replay(state.difficulty, state.seed)
+
+    def record(self, state, inputs):
+        """step(state, inputs, ...)을 부르기 직전에 호출"""
+        for action in inputs:
+            self.replay.events.append((state.steps, action))
+
+    def finish(self, state):
+        self.replay.end_step = state.steps
+        self.replay.outcome = state.game_over_message
+        return self.replay
+
+# ───── 인코딩 ─────
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("리플레이 입력 데이터가 잘렸습니다")
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if b < 0x80:
+            return value, pos
+        shift += 7
+
+def encode_replay(replay):
+    d = replay.difficulty
+    flags = _FLAG_HARD if getattr(d, 'name', '') in ["Hard", "어려움"] else 0
+    gen_id, _ = GENERATOR_IDS[replay.generator]
+    out = bytearray(_HEADER.pack(
+        REPLAY_MAGIC, REPLAY_FORMAT_VERSION, flags, gen_id, OUTCOME_CODES[replay.outcome],
+        d.width, d.height, d.cell, d.time_limit, replay.seed,
+        replay.end_step, len(replay.events)))
+    prev = 0
+    for step_no, action in replay.events:
+        _write_varint(out, (step_no - prev) << 3 | INPUT_CODES[action])
+        prev = step_no
+    return bytes(out)
+
+def decode_replay(data):
+    if len(data) < _HEADER.size:
+        raise ValueError("리플레이 파일이 너무 짧습니다")
+    (magic, version, flags, gen_id, outcome, width, height, cell, time_limit,
+     seed, end_step, count) = _HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC:
+        raise ValueError("리플레이 파일이 아닙니다")
+    if version != REPLAY_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 리플레이 버전: {version}")
+    generator = next((name for name, (gid, _) in GENERATOR_IDS.items() if gid == gen_id), None)
+    if generator is None or outcome not in _CODE_OUTCOMES:
+        raise ValueError("리플레이 헤더가 잘못되었습니다")
+
+    name = "Hard" if flags & _FLAG_HARD else "Easy"
+    difficulty = Difficulty(width=width, height=height, cell=cell, time_limit=time_limit, name=name,
+                            generator=generator)
+    events = []
+    pos, step_no = _HEADER.size, 0
+    for _ in range(count):
+        value, pos = _read_varint(data, pos)
+        step_no += value >> 3
+        action = _CODE_INPUTS.get(value & 7)
+        if action is None:
+            raise ValueError("리플레이에 알 수 없는 입력이 있습니다")
+        events.append((step_no, action))
+    return Replay(difficulty, seed, events, end_step, _CODE_OUTCOMES[outcome], generator)
+
+def save_replay(path, replay):
+    with open(path, "wb") as f:
+        f.write(encode_replay(replay))
+
+def load_replay(path):
+    with open(path, "rb") as f:
+        return decode_replay(f.read())
+
+# ───── 헤드리스 재생/검증 ─────
+def simulate(replay):
+    """화면 없이 리플레이를 끝까지 돌린 GameState 반환
+    입력이 없는 구간은 skip_idle로 건너뛰어서 기록 길이보다 훨씬 빠르게 끝난다"""
+    state = replay.new_game()
+    events, i, n = replay.events, 0, len(replay.events)
+    end = replay.end_step
+    while state.steps < end and not state.game_over_message:
+        if i < n and events[i][0] == state.steps:
+            inputs = []
+            while i < n and events[i][0] == state.steps:
+                inputs.append(events[i][1])
+                i += 1
+            step(state, inputs, STEP_MS)
+            continue
+        next_input = events[i][0] if i < n else end
+        if not skip_idle(state, next_input - state.steps):
+            step(state, (), STEP_MS)
+    return state
+
+def verify_replay(replay):
+    """리플레이를 다시 돌려서 기록된 결과와 같은지 확인 -> (일치 여부, 재생 결과, 끝난 step 수)"""
+    state = simulate(replay)
+    ok = state.game_over_message == replay.outcome and state.steps == replay.end_step
+    return ok, state.game_over_message, state.steps
+
+def _verify_file(path):
+    try:
+        return (path,) + verify_replay(load_replay(path))
+    except (OSError, ValueError) as e:
+        return path, False, f"error: {e}", 0
+
+def verify_files(paths, jobs=None):
+    """여러 리플레이 파일을 프로세스 여러 개로 나눠 검증 -> (경로, 일치 여부, 결과, step 수) 목록"""
+    if jobs == 1 or len(paths) < 2:
+        return [_verify_file(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_verify_file, paths, chunksize=16))
+
+# ───── 화면 재생 ─────
+def play_replay(replay, speed=1):
+    """pygame 창에서 리플레이를 speed 배속으로 재생 (1/2/3 키: 1배/4배/16배, ESC로 종료)"""
+    import pygame
+    from main import draw_world, camera_focus, initial_window_size, RENDER_FPS
+    from renderer import draw_maze_view, follow_view
+
+    state = replay.new_game()
+    pygame.init()
+    screen = pygame.display.set_mode(initial_window_size(state.width * state.cell_size, state.height * state.cell_size),
+                                     pygame.RESIZABLE)
+    hud_font = pygame.font.Font(None, 24)
+    clock = pygame.time.Clock()
+    speed_keys = {pygame.K_1: 1, pygame.K_2: 4, pygame.K_3: 16}
+
+    timestep = FixedTimestep(max_steps=MAX_STEPS_PER_FRAME * max(PLAY_SPEEDS))
+    events, i = replay.events, 0
+    while True:
+        pygame.display.set_caption(f"Replay (seed={replay.seed}) x{speed}")
+        dt = clock.tick(RENDER_FPS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit(); return state
+            if event.type == pygame.VIDEORESIZE:
+                screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    pygame.quit(); return state
+                speed = speed_keys.get(event.key, speed)
+
+        for _ in range(timestep.advance(dt * speed)):
+            if state.game_over_message or state.steps >= replay.end_step:
+                break
+            inputs = []
+            while i < len(events) and events[i][0] == state.steps:
+                inputs.append(events[i][1])
+                i += 1
+            step(state, inputs, STEP_MS)
+
+        view = follow_view(screen.get_size(), state.width, state.height, state.cell_size,
+                           camera_focus(state, timestep.alpha))
+        draw_maze_view(screen, state.grid, view, state.goal_x, state.goal_y, state.wall_segments())
+        draw_world(screen, state, view, timestep.alpha, hud_font)
+        pygame.display.flip()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="미로 게임 리플레이 재생/검증")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_verify = sub.add_parser("verify", help="화면 없이 다시 돌려서 결과 확인")
+    p_verify.add_argument("files", nargs="+")
+    p_verify.add_argument("--jobs", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    p_play = sub.add_parser("play", help="화면에서 재생")
+    p_play.add_argument("file")
+    p_play.add_argument("--speed", type=int, choices=PLAY_SPEEDS, default=1)
+    args = parser.parse_args(argv)
+
+    if args.command == "play":
+        play_replay(load_replay(args.file), args.speed)
+        return 0
+
+    failed = 0
+    for path, ok, outcome, steps in verify_files(args.files, args.jobs):
+        if not ok:
+            failed += 1
+            print(f"MISMATCH {path}: {outcome or 'unfinished'} @ step {steps}")
+    print(f"{len(args.files) - failed}/{len(args.files)} replays verified")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""미로 지표로 seed를 고르는 SQLite seed 은행
+
+(width, height, algorithm, seed) -> 미리 계산한 지표(maze_batch.COLUMNS)를 저장하고,
+지표마다 인덱스를 걸어 둔다. 난이도 목표 구간(Difficulty.target)에 드는 seed에는 build/import 때
+0부터 순번을 매겨 두어서(band_seeds), 세션 시작 때는 무작위 순번 하나를 기본 키로 조회해서 뽑는다
+(그 자리에서 미로를 만들어 보거나 구간을 훑지 않는다).
+
+사용법 (code/ 에서)
+  python seed_bank.py build --size 30x30 --count 100000 [--jobs N]   # maze_batch로 계산 후 저장
+  python seed_bank.py import out/30x30                               # maze_batch 결과 디렉터리 가져오기
+  python seed_bank.py pick --size 30x30 --band solution_length=80:130"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from maze_batch import COLUMNS, MANIFEST, generate_batch, load_results
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed_bank.sqlite")
+METRICS = tuple(name for name, _ in COLUMNS if name != "seed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mazes (
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    {metric_columns},
+    PRIMARY KEY (width, height, algorithm, seed)
+) WITHOUT ROWID;
+{metric_indexes}
+CREATE TABLE IF NOT EXISTS bands (
+    band_id INTEGER PRIMARY KEY,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    band TEXT NOT NULL,  -- 구간 JSON (_band_key)
+    count INTEGER NOT NULL,
+    UNIQUE (width, height, algorithm, band)
+);
+CREATE TABLE IF NOT EXISTS band_seeds (
+    band_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,  -- 구간 안에서 seed 순서대로 0, 1, 2, ...
+    seed INTEGER NOT NULL,
+    PRIMARY KEY (band_id, rank)
+) WITHOUT ROWID;
+""".format(
+    metric_columns=",\n    ".join(f"{m} {'REAL' if m == 'branching_factor' else 'INTEGER'} NOT NULL" for m in METRICS),
+    metric_indexes="\n".join(
+        f"CREATE INDEX IF NOT EXISTS idx_mazes_{m} ON mazes (width, height, algorithm, {m});" for m in METRICS),
+)
+
+class SeedBank:
+    """seed 지표 데이터베이스
+    target(band): {지표 이름: (최소, 최대)} 형태, 최소/최대는 None이면 제한 없음 (양 끝 포함)"""
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def add_columns(self, width, height, algorithm, columns):
+        """maze_batch.load_results 형태({열 이름: 배열})의 결과를 저장, 저장한 행 수 반환"""
+        names = ("seed",) + METRICS
+        rows = zip(*(columns[name] for name in names))
+        sql = (f"INSERT OR REPLACE INTO mazes (width, height, algorithm, {', '.join(names)}) "
+               f"VALUES (?, ?, ?, {', '.join('?' * len(names))})")
+        with self.conn:
+            cur = self.conn.executemany(sql, ((width, height, algorithm) + tuple(r) for r in rows))
+            # 행이 바뀌었으니 이 크기/알고리즘의 구간 순번은 버림 (다음 prepare_band 또는 pick 때 다시 매김)
+            self.conn.execute("DELETE FROM band_seeds WHERE band_id IN "
+                              "(SELECT band_id FROM bands WHERE width = ? AND height = ? AND algorithm = ?)",
+                              (width, height, algorithm))
+            self.conn.execute("DELETE FROM bands WHERE width = ? AND height = ? AND algorithm = ?",
+                              (width, height, algorithm))
+        return cur.rowcount
+
+    def import_batch(self, out_dir):
+        """maze_batch generate 결과 디렉터리를 통째로 가져온다"""
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            manifest = json.load(f)
+        return self.add_columns(manifest["width"], manifest["height"], manifest["algorithm"],
+                                load_results(out_dir))
+
+    def count(self, width, height, algorithm="kruskal", target=None):
+        where, params = _band_clause(width, height, algorithm, target)
+        return self.conn.execute(f"SELECT COUNT(*) FROM mazes WHERE {where}", params).fetchone()[0]
+
+    def prepare_band(self, width, height, algorithm="kruskal", target=None):
+        """구간에 드는 seed에 seed 순서로 0부터 순번을 매겨 저장하고 (band_id, 개수) 반환
+        build/import 때 해 두면 pick()은 기본 키 조회 두 번으로 끝난다 (안 해 뒀으면 첫 pick 때 한 번)"""
+        key = (width, height, algorithm, _band_key(target))
+        where, params = _band_clause(width, height, algorithm, target)
+        with self.conn:
+            self.conn.execute("DELETE FROM band_seeds WHERE band_id IN (SELECT band_id FROM bands "
+                              "WHERE width = ? AND height = ? AND algorithm = ? AND band = ?)", key)
+            self.conn.execute("DELETE FROM bands WHERE width = ? AND height = ? AND algorithm = ? AND band = ?", key)
+            band_id = self.conn.execute(
+                "INSERT INTO bands (width, height, algorithm, band, count) VALUES (?, ?, ?, ?, 0)", key).lastrowid
+            count = self.conn.execute(
+                f"INSERT INTO band_seeds (band_id, rank, seed) "
+                f"SELECT ?, ROW_NUMBER() OVER (ORDER BY seed) - 1, seed FROM mazes WHERE {where}",
+                (band_id,) + params).rowcount
+            self.conn.execute("UPDATE bands SET count = ? WHERE band_id = ?", (count, band_id))
+        return band_id, count
+
+    def pick(self, width, height, algorithm="kruskal", target=None, rng=random):
+        """목표 구간에 맞는 seed 하나를 고르게 무작위로 (없으면 None)
+        구간 순번(prepare_band) 중 하나를 무작위로 골라 기본 키로 읽는다 (구간 크기와 상관없이 조회 두 번)"""
+        row = self.conn.execute(
+            "SELECT band_id, count FROM bands WHERE width = ? AND height = ? AND algorithm = ? AND band = ?",
+            (width, height, algorithm, _band_key(target))).fetchone()
+        band_id, count = row if row else self.prepare_band(width, height, algorithm, target)
+        seed = self._seed_at(band_id, count, rng)
+        if seed is None and count:
+            # 다른 프로세스가 그 사이 행을 추가해서 순번이 지워졌으면 다시 매기고 한 번 더
+            band_id, count = self.prepare_band(width, height, algorithm, target)
+            seed = self._seed_at(band_id, count, rng)
+        return seed
+
+    def _seed_at(self, band_id, count, rng):
+        if not count:
+            return None
+        row = self.conn.execute("SELECT seed FROM band_seeds WHERE band_id = ? AND rank = ?",
+                                (band_id, rng.randrange(count))).fetchone()
+        return row[0] if row else None
+
+    def metrics(self, width, height, seed, algorithm="kruskal"):
+        row = self.conn.execute(
+            f"SELECT {', '.join(METRICS)} FROM mazes WHERE width = ? AND height = ? AND algorithm = ? AND seed = ?",
+            (width, height, algorithm, seed)).fetchone()
+        return dict(zip(METRICS, row)) if row else None
+
+def _band_key(target):
+    """구간 dict -> bands 테이블 키 (지표 이름 순서, 80 / 80.0 표기와 상관없이 같은 문자열)"""
+    return json.dumps(sorted((metric, [None if v is None else float(v) for v in band])
+                             for metric, band in (target or {}).items()))
+
+def _band_clause(width, height, algorithm, target):
+    where = ["width = ?", "height = ?", "algorithm = ?"]
+    params = [width, height, algorithm]
+    for metric, (lo, hi) in (target or {}).items():
+        if metric not in METRICS:
+            raise ValueError(f"알 수 없는 지표: {metric}")
+        if lo is not None:
+            where.append(f"{metric} >= ?")
+            params.append(lo)
+        if hi is not None:
+            where.append(f"{metric} <= ?")
+            params.append(hi)
+    return " AND ".join(where), tuple(params)
+
+# ───── 게임에서 쓰는 기본 은행 ─────
+_default_bank = None
+
+def get_default_bank():
+    """code/seed_bank.sqlite 가 있으면 열어서 재사용, 없으면 None (게임은 예전처럼 무작위 seed)"""
+    global _default_bank
+    if _default_bank is None and os.path.exists(DEFAULT_PATH):
+        _default_bank = SeedBank(DEFAULT_PATH)
+    return _default_bank
+
+def pick_session_seed(difficulty, rng=random, algorithm=None):
+    """난이도 목표 구간에 맞는 seed, 은행이 없거나 맞는 seed가 없으면 무작위 seed
+    algorithm을 안 주면 난이도의 생성 알고리즘(difficulty.generator) 기준"""
+    algorithm = algorithm or getattr(difficulty, "generator", "kruskal")
+    bank = get_default_bank()
+    target = getattr(difficulty, "target", None)
+    if bank is not None:
+        try:
+            seed = bank.pick(difficulty.width, difficulty.height, algorithm, target, rng)
+        except sqlite3.Error:
+            seed = None
+        if seed is not None:
+            return seed
+    return rng.randint(0, 999999)
+
+def _parse_size(text):
+    w, _, h = text.lower().partition("x")
+    return int(w), int(h or w)
+
+def _parse_band(text):
+    """"solution_length=80:130" -> ("solution_length", (80, 130)), 빈 쪽은 제한 없음"""
+    metric, _, rng = text.partition("=")
+    lo, _, hi = rng.partition(":")
+    return metric, (float(lo) if lo else None, float(hi) if hi else None)
+
+def _prepare_bands(bank, width, height, algorithm, extra_bands):
+    """같은 크기/알고리즘 난이도의 목표 구간(+ --band)에 순번을 매겨 둔다 (게임 첫 pick이 구간을 세지 않도록)"""
+    from difficulty import EASY, HARD  # CLI에서만 필요 (게임은 pick_session_seed 만 씀)
+    targets = [d.target for d in (EASY, HARD)
+               if (d.width, d.height, d.generator) == (width, height, algorithm) and d.target]
+    if extra_bands:
+        targets.append(dict(extra_bands))
+    for target in targets:
+        _, count = bank.prepare_band(width, height, algorithm, target)
+        print(f"band {target}: {count} seeds")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="미로 지표 seed 은행")
+    parser.add_argument("--db", default=DEFAULT_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="maze_batch로 지표를 계산해서 저장")
+    p_build.add_argument("--size", type=_parse_size, default=(30, 30))
+    p_build.add_argument("--count", type=int, default=100_000)
+    p_build.add_argument("--start-seed", type=int, default=0)
+    p_build.add_argument("--algorithm", default="kruskal")
+    p_build.add_argument("--jobs", type=int, default=None)
+    p_build.add_argument("--work-dir", default=None, help="maze_batch 결과 저장 위치 (기본: db 옆)")
+    p_import = sub.add_parser("import", help="maze_batch 결과 디렉터리 가져오기")
+    p_import.add_argument("out_dirs", nargs="+")
+    for p in (p_build, p_import):
+        p.add_argument("--band", type=_parse_band, action="append", default=[],
+                       help="난이도 목표 구간 말고도 순번을 미리 매겨 둘 구간 (예: solution_length=80:130)")
+    p_pick = sub.add_parser("pick", help="구간에 맞는 seed 뽑기")
+    p_pick.add_argument("--size", type=_parse_size, default=(30, 30))
+    p_pick.add_argument("--algorithm", default="kruskal")
+    p_pick.add_argument("--band", type=_parse_band, action="append", default=[], help="예: solution_length=80:130")
+    args = parser.parse_args(argv)
+
+    bank = SeedBank(args.db)
+    if args.command == "build":
+        width, height = args.size
+        work_dir = args.work_dir or f"{args.db}.batch/{args.algorithm}_{width}x{height}_{args.start_seed}_{args.count}"
+        generate_batch(work_dir, width, height, args.count, args.start_seed, args.algorithm, jobs=args.jobs)
+        print(f"{bank.import_batch(work_dir)} seeds stored in {args.db}")
+        _prepare_bands(bank, width, height, args.algorithm, args.band)
+    elif args.command == "import":
+        for out_dir in args.out_dirs:
+            print(f"{out_dir}: {bank.import_batch(out_dir)} seeds")
+            with open(os.path.join(out_dir, MANIFEST)) as f:
+                manifest = json.load(f)
+            _prepare_bands(bank, manifest["width"], manifest["height"], manifest["algorithm"], args.band)
+    else:
+        width, height = args.size
+        target = dict(args.band)
+        t0 = time.perf_counter()
+        seed = bank.pick(width, height, args.algorithm, target)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"seed={seed} ({bank.count(width, height, args.algorithm, target)} matching, {elapsed:.3f} ms)")
+        if seed is not None:
+            print(bank.metrics(width, height, seed, args.algorithm))
+    bank.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""미로 벽 도형: 칸 비트마스크 -> 겹치지 않는 가로/세로 벽 선분 목록 (pygame 임포트 없음)
+
+칸마다 4방향 벽을 따로 그리면 안쪽 벽은 두 번씩 (칸 (x, y)의 S = 칸 (x, y+1)의 N) 그려지고,
+한 줄로 이어진 벽도 칸 수만큼 선으로 쪼개진다. 여기서는 격자선 하나하나를 훑어서
+벽이 있는 구간을 한 번씩만, 이어진 구간은 긴 선분 하나로 만든다.
+
+좌표는 격자선 단위 (칸 (x, y)의 왼쪽 위 모서리 = (x, y)), 픽셀 크기는 그리는 쪽에서 곱한다
+  가로 선분 i: (h_line[i], h_start[i]) - (h_end[i], h_line[i])   # y = h_line, x: h_start ~ h_end
+  세로 선분 i: (v_line[i], v_start[i]) - (v_line[i], v_end[i])   # x = v_line, y: v_start ~ v_end
+같은 격자선의 선분은 시작 위치 순서라서 화면/조각 범위 안의 선분만 이분 탐색으로 고를 수 있다.
+
+쓰는 곳: renderer 미로 레이어/벽 조각, to_svg() 내보내기, to_dict() (JS 프런트엔드용 JSON)
+세션 미로의 선분은 GameState.wall_segments()가 한 번만 만들어 보관한다 (여기에는 전역 캐시 없음)"""
+from array import array
+from bisect import bisect_left
+from maze import N, S, E, W
+from pathfinding import flat_cells
+
+# 칸 값 -> 그 방향이 막혀 있으면 1 (bytes.translate 로 한 줄을 C 수준에서 한 번에 변환)
+_CLOSED = {d: bytes(0 if c & d else 1 for c in range(256)) for d in (N, S, E, W)}
+
+class WallSegments:
+    def __init__(self, width, height, h_line, h_start, h_end, h_index, v_line, v_start, v_end, v_index):
+        self.width = width
+        self.height = height
+        self.h_line, self.h_start, self.h_end = h_line, h_start, h_end
+        self.v_line, self.v_start, self.v_end = v_line, v_start, v_end
+        self.h_index = h_index  # h_index[y] ~ h_index[y + 1]: 가로 격자선 y 의 선분 번호 범위
+        self.v_index = v_index
+
+    def __len__(self):
+        return len(self.h_line) + len(self.v_line)
+
+    def segments(self):
+        """((x0, y0), (x1, y1)) 순회 (가로 선분 먼저)"""
+        for y, x0, x1 in zip(self.h_line, self.h_start, self.h_end):
+            yield (x0, y), (x1, y)
+        for x, y0, y1 in zip(self.v_line, self.v_start, self.v_end):
+            yield (x, y0), (x, y1)
+
+    def in_rect(self, x0, y0, x1, y1):
+        """격자선 좌표 [x0, x1] x [y0, y1] 범위에 닿는 선분만 ((x0, y0), (x1, y1)) 순회 (범위 밖 부분은 잘리지 않음)"""
+        yield from _runs_in_range(self.h_index, self.h_start, self.h_end, y0, y1, x0, x1, False)
+        yield from _runs_in_range(self.v_index, self.v_start, self.v_end, x0, x1, y0, y1, True)
+
+    def to_dict(self):
+        """JSON으로 보낼 수 있는 dict: h/v 는 [격자선, 시작, 끝, ...] 세 개씩 이어 붙인 목록"""
+        def flat(lines, starts, ends):
+            return [v for triple in zip(lines, starts, ends) for v in triple]
+        return {
+            "width": self.width,
+            "height": self.height,
+            "h": flat(self.h_line, self.h_start, self.h_end),
+            "v": flat(self.v_line, self.v_start, self.v_end),
+        }
+
+def _runs_in_range(index, starts, ends, line0, line1, lo, hi, vertical):
+    line0, line1 = max(0, line0), min(len(index) - 2, line1)
+    for line in range(line0, line1 + 1):
+        first, last = index[line], index[line + 1]
+        i = bisect_left(ends, lo, first, last)  # 끝이 lo 이상인 첫 선분 (같은 격자선 안에서는 정렬돼 있음)
+        while i < last and starts[i] <= hi:
+            if vertical:
+                yield (line, starts[i]), (line, ends[i])
+            else:
+                yield (starts[i], line), (ends[i], line)
+            i += 1
+
+def _add_runs(flags, line, lines, starts, ends):
+    """flags(0/1 bytes)에서 1이 이어진 구간마다 선분 하나"""
+    pos = flags.find(1)
+    n = len(flags)
+    while pos >= 0:
+        end = flags.find(0, pos)
+        if end < 0:
+            end = n
+        lines.append(line)
+        starts.append(pos)
+        ends.append(end)
+        pos = flags.find(1, end)
+
+def _either(a, b):
+    """두 0/1 bytes 의 OR (한쪽 칸이라도 막혀 있으면 벽, 예전 그리기와 같은 기준)"""
+    return (int.from_bytes(a, "little") | int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+def build_wall_segments(grid):
+    height = len(grid)
+    width = len(grid[0])
+    cells = bytes(flat_cells(grid, width))
+
+    h_line, h_start, h_end, h_index = array('i'), array('i'), array('i'), array('i')
+    rows = [cells[y * width:(y + 1) * width] for y in range(height)]
+    for y in range(height + 1):
+        h_index.append(len(h_line))
+        if y == 0:
+            flags = rows[0].translate(_CLOSED[N])
+        elif y == height:
+            flags = rows[-1].translate(_CLOSED[S])
+        else:
+            flags = _either(rows[y].translate(_CLOSED[N]), rows[y - 1].translate(_CLOSED[S]))
+        _add_runs(flags, y, h_line, h_start, h_end)
+    h_index.append(len(h_line))
+
+    v_line, v_start, v_end, v_index = array('i'), array('i'), array('i'), array('i')
+    cols = [cells[x::width] for x in range(width)]
+    for x in range(width + 1):
+        v_index.append(len(v_line))
+        if x == 0:
+            flags = cols[0].translate(_CLOSED[W])
+        elif x == width:
+            flags = cols[-1].translate(_CLOSED[E])
+        else:
+            flags = _either(cols[x].translate(_CLOSED[W]), cols[x - 1].translate(_CLOSED[E]))
+        _add_runs(flags, x, v_line, v_start, v_end)
+    v_index.append(len(v_line))
+
+    return WallSegments(width, height, h_line, h_start, h_end, h_index, v_line, v_start, v_end, v_index)
+
+# ───── 내보내기 ─────
+def to_svg(walls, cell_size=20, stroke=2, goal=None):
+    """벽 선분을 path 하나로 담은 SVG 문자열 (goal=(x, y)면 도착점 빨간 원도)"""
+    c = cell_size
+    d = [f"M{x0 * c} {y * c}H{x1 * c}" for y, x0, x1 in zip(walls.h_line, walls.h_start, walls.h_end)]
+    d += [f"M{x * c} {y0 * c}V{y1 * c}" for x, y0, y1 in zip(walls.v_line, walls.v_start, walls.v_end)]
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{walls.width * c}" height="{walls.height * c}">',
+        '<rect width="100%" height="100%" fill="#fff"/>',
+        f'<path d="{"".join(d)}" stroke="#000" stroke-width="{stroke}" stroke-linecap="square" fill="none"/>',
+    ]
+    if goal is not None:
+        gx, gy = goal
+        parts.append(f'<circle cx="{gx * c + c // 2}" cy="{gy * c + c // 2}" r="{max(6, c // 3)}" fill="red"/>')
+    parts.append("</svg>")
+    return "\n".join(parts)
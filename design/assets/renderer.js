@@ -2,9 +2,68 @@
 
 import { N, S, E, W } from "./maze.js";
 
+/**
+ * wallSegments(grid)
+ * - Python wall_geometry.build_wall_segments() 와 같은 결과 (to_dict() JSON 형식)
+ * - 벽 하나는 한 번만, 한 줄로 이어진 벽은 선분 하나: { width, height, h: [y, x0, x1, ...], v: [x, y0, y1, ...] }
+ * - grid 별로 WeakMap 에 캐시 (매 프레임 다시 계산하지 않음)
+ */
+const wallCache = new WeakMap();
+
+export function wallSegments(grid) {
+    let walls = wallCache.get(grid);
+    if (walls) return walls;
+
+    const h = grid.length;
+    const w = grid[0].length;
+    const hs = [];
+    const vs = [];
+    // 한쪽 칸이라도 막혀 있으면 벽 (예전 그리기와 같은 기준)
+    for (let y = 0; y <= h; y++) {
+        let start = -1;
+        for (let x = 0; x <= w; x++) {
+            const closed = x < w && ((y < h && !(grid[y][x] & N)) || (y > 0 && !(grid[y - 1][x] & S)));
+            if (closed && start < 0) start = x;
+            if (!closed && start >= 0) { hs.push(y, start, x); start = -1; }
+        }
+    }
+    for (let x = 0; x <= w; x++) {
+        let start = -1;
+        for (let y = 0; y <= h; y++) {
+            const closed = y < h && ((x < w && !(grid[y][x] & W)) || (x > 0 && !(grid[y][x - 1] & E)));
+            if (closed && start < 0) start = y;
+            if (!closed && start >= 0) { vs.push(x, start, y); start = -1; }
+        }
+    }
+    walls = { width: w, height: h, h: hs, v: vs };
+    wallCache.set(grid, walls);
+    return walls;
+}
+
+/**
+ * drawWallSegments(ctx, walls, cellSize)
+ * - wallSegments() 나 서버(Python to_dict())에서 받은 선분을 path 하나로 그림 (stroke 한 번)
+ */
+export function drawWallSegments(ctx, walls, cellSize) {
+    ctx.strokeStyle = "#000000";
+    ctx.lineWidth = 2;
+    ctx.beginPath();
+    const hs = walls.h;
+    for (let i = 0; i < hs.length; i += 3) {
+        ctx.moveTo(hs[i + 1] * cellSize, hs[i] * cellSize);
+        ctx.lineTo(hs[i + 2] * cellSize, hs[i] * cellSize);
+    }
+    const vs = walls.v;
+    for (let i = 0; i < vs.length; i += 3) {
+        ctx.moveTo(vs[i] * cellSize, vs[i + 1] * cellSize);
+        ctx.lineTo(vs[i] * cellSize, vs[i + 2] * cellSize);
+    }
+    ctx.stroke();
+}
+
 /**
  * drawMaze(ctx, grid, cellSize, goal_x, goal_y)
- * - Python draw_maze() 1:1 변환
+ * - Python draw_maze() 1:1 변환 (벽은 wallSegments() 선분으로)
  */
 export function drawMaze(ctx, grid, cellSize, goalX, goalY) {
     const h = grid.length;
@@ -14,45 +73,7 @@ export function drawMaze(ctx, grid, cellSize, goalX, goalY) {
     ctx.fillStyle = "#FFFFFF";
     ctx.fillRect(0, 0, w * cellSize, h * cellSize);
 
-    ctx.strokeStyle = "#000000";
-    ctx.lineWidth = 2;
-
-    for (let y = 0; y < h; y++) {
-        for (let x = 0; x < w; x++) {
-            const cx = x * cellSize;
-            const cy = y * cellSize;
-            const cell = grid[y][x];
-
-            // 위쪽 벽
-            if (!(cell & N)) {
-                ctx.beginPath();
-                ctx.moveTo(cx, cy);
-                ctx.lineTo(cx + cellSize, cy);
-                ctx.stroke();
-            }
-            // 왼쪽 벽
-            if (!(cell & W)) {
-                ctx.beginPath();
-                ctx.moveTo(cx, cy);
-                ctx.lineTo(cx, cy + cellSize);
-                ctx.stroke();
-            }
-            // 아래쪽 벽
-            if (!(cell & S)) {
-                ctx.beginPath();
-                ctx.moveTo(cx, cy + cellSize);
-                ctx.lineTo(cx + cellSize, cy + cellSize);
-                ctx.stroke();
-            }
-            // 오른쪽 벽
-            if (!(cell & E)) {
-                ctx.beginPath();
-                ctx.moveTo(cx + cellSize, cy);
-                ctx.lineTo(cx + cellSize, cy + cellSize);
-                ctx.stroke();
-            }
-        }
-    }
+    drawWallSegments(ctx, wallSegments(grid), cellSize);
 
     // 골(빨간 원)
     const gx = goalX * cellSize + cellSize / 2;